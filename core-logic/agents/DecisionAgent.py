@@ -5,14 +5,23 @@ Quantum-Speed Strategy Selection and Risk Assessment
 """
 
 import numpy as np
-import pandas as pd
 import asyncio
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
+import logging
+import math
+from collections import deque
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Tuple, Any
+from dataclasses import dataclass, field
 from enum import Enum
-from datetime import datetime, timedelta
-import warnings
-warnings.filterwarnings('ignore')
+from datetime import datetime
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
 
 class DecisionType(Enum):
     STRATEGIC = "strategic"
@@ -31,7 +40,7 @@ class RiskAppetite(Enum):
     MODERATE = "moderate"
     AGGRESSIVE = "aggressive"
 
-@dataclass
+@dataclass(slots=True)
 class DecisionContext:
     context_id: str
     timestamp: datetime
@@ -41,14 +50,52 @@ class DecisionContext:
     constraints: Dict[str, Any]
     objectives: List[str]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class ActionPlan:
+    strategy: str
+    position_size: float
+    profit_target: float = 0.0
+    stop_loss: float = 0.0
+    spread_target: float = 0.0
+    inventory_management: str = ''
+
+@dataclass(slots=True)
 class DecisionOption:
     option_id: str
     description: str
-    action_plan: Dict[str, Any]
+    action_plan: ActionPlan
     expected_utility: float
-    risk_metrics: Dict[str, float]
+    risk_metrics: Mapping[str, float]
     confidence: float
+    _risk_mean: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Every evaluation pass reads the mean risk, so it is computed once per option
+        self._risk_mean = sum(self.risk_metrics.values()) / len(self.risk_metrics)
+
+def _prospect_value_kernel(utility, loss_aversion, out):
+    """Prospect theory value of each utility, written into out"""
+    for i in range(utility.shape[0]):
+        u = utility[i]
+        if u >= 0:
+            # Gains domain
+            out[i] = u ** 0.88
+        else:
+            # Losses domain (apply loss aversion)
+            out[i] = -loss_aversion * (-u)
+
+def _bayes_update_kernel(prior_log_odds, likelihood, utility, out_confidence, out_utility):
+    """Posterior confidence of each option in log-odds form, and its posterior-weighted utility"""
+    for i in range(likelihood.shape[0]):
+        # Clipped away from 0 and 1 so the log-odds stay finite
+        l = min(max(likelihood[i], 1e-6), 1.0 - 1e-6)
+        posterior = 1.0 / (1.0 + math.exp(-(prior_log_odds + math.log(l) - math.log1p(-l))))
+        out_confidence[i] = posterior
+        out_utility[i] = utility[i] * posterior
+
+if NUMBA_AVAILABLE:
+    _prospect_value_kernel = njit(fastmath=True)(_prospect_value_kernel)
+    _bayes_update_kernel = njit(fastmath=True)(_bayes_update_kernel)
 
 class DecisionAgent:
     """
@@ -61,35 +108,73 @@ class DecisionAgent:
         self.risk_appetite = risk_appetite
         
         # Decision history and learning
-        self.decision_history = []
+        self.decision_history: deque = deque(maxlen=10000)  # chronological decision records
+        self._decision_index: Dict[str, Dict[str, Any]] = {}  # option_id -> latest decision record
         self.performance_metrics = {
             'decisions_made': 0,
-            'successful_decisions': 0,
-            'avg_decision_quality': 0.0
+            'successful_decisions': 0
         }
         
+        # Running mean and sum of squared deviations (Welford) of learned decision quality
+        self._outcomes_learned = 0
+        self._quality_mean = 0.0
+        self._quality_m2 = 0.0
+        
         # Risk parameters based on appetite
         self.risk_parameters = self._initialize_risk_parameters()
         
+        # Action plans depend only on the risk parameters, so each strategy's is frozen once here
+        position_size_limit = self.risk_parameters['position_size_limit']
+        profit_threshold = self.risk_parameters['profit_threshold']
+        drawdown_tolerance = self.risk_parameters['max_drawdown_tolerance']
+        self._aggressive_plan = ActionPlan(
+            strategy='aggressive_arbitrage',
+            position_size=position_size_limit * 0.8,
+            profit_target=profit_threshold * 2,
+            stop_loss=drawdown_tolerance * 0.5
+        )
+        self._conservative_plan = ActionPlan(
+            strategy='conservative_arbitrage',
+            position_size=position_size_limit * 0.4,
+            profit_target=profit_threshold,
+            stop_loss=drawdown_tolerance * 0.3
+        )
+        self._market_making_plan = ActionPlan(
+            strategy='market_making',
+            position_size=position_size_limit * 0.6,
+            spread_target=0.002,
+            inventory_management='dynamic'
+        )
+        
+        # Option generators per market regime, with the regime's strategies and utilities baked in
+        self._option_builders = {
+            regime: self._make_option_builder(regime)
+            for regime in ('volatile', 'transition', 'stable', 'bull')
+        }
+        self._default_option_builder = self._make_option_builder(None)
+        
         # Decision frameworks
         self.decision_frameworks = {
             DecisionFramework.UTILITY_MAXIMIZATION: {
                 'description': 'Maximize expected utility',
-                'evaluate': self._evaluate_utility_maximization
+                'evaluate': self._evaluate_utility_maximization,
+                'evaluate_arrays': self._utility_maximization_arrays
             },
             DecisionFramework.PROSPECT_THEORY: {
                 'description': 'Prospect theory with loss aversion',
-                'evaluate': self._evaluate_prospect_theory
+                'evaluate': self._evaluate_prospect_theory,
+                'evaluate_arrays': self._prospect_theory_arrays
             },
             DecisionFramework.BAYESIAN: {
                 'description': 'Bayesian decision theory',
-                'evaluate': self._evaluate_bayesian
+                'evaluate': self._evaluate_bayesian,
+                'evaluate_arrays': self._bayesian_arrays
             }
         }
         
         self.active_framework = DecisionFramework.UTILITY_MAXIMIZATION
         
-        print(f"✅ Decision Agent {agent_id} initialized with {risk_appetite.value} risk appetite")
+        logger.info("✅ Decision Agent %s initialized with %s risk appetite", agent_id, risk_appetite.value)
 
     def _initialize_risk_parameters(self) -> Dict[str, Any]:
         """Initialize risk parameters based on risk appetite"""
@@ -120,177 +205,224 @@ class DecisionAgent:
         """
         Make strategic decision based on context and active framework
         """
-        print(f" Decision Agent making decision for context: {context.context_id}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🧠 Decision Agent making decision for context: %s", context.context_id)
         
         # Generate decision options
-        decision_options = await self._generate_decision_options(context)
+        decision_options = self._generate_decision_options(context)
         
         if not decision_options:
             raise ValueError("No valid decision options generated")
         
-        # Evaluate options using active framework
-        framework = self.decision_frameworks[self.active_framework]
-        evaluated_options = await framework['evaluate'](decision_options, context)
+        # Evaluate options using active framework; the same arrays feed the scoring
+        utility, risk, confidence = self._options_to_soa(decision_options)
+        utility, confidence = self._active_evaluate_arrays(utility, risk, confidence)
+        self._write_back_soa(decision_options, utility, confidence)
         
         # Select best option
-        selected_option = self._select_best_option(evaluated_options, context)
+        scores = self._calculate_option_scores(utility, risk, confidence)
+        selected_option = self._select_best_option(decision_options, context, scores)
         
         # Update performance metrics
-        self.decision_history.append({
+        self._record_decision(context, selected_option)
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("✅ Decision made: %s with confidence %.3f", selected_option.option_id, selected_option.confidence)
+        
+        return selected_option
+
+    async def make_decisions(self, contexts: List[DecisionContext]) -> List[DecisionOption]:
+        """
+        Make decisions for a batch of contexts, evaluating and scoring every candidate option in one pass
+        """
+        if not contexts:
+            return []
+        
+        option_lists = [self._generate_decision_options(context) for context in contexts]
+        
+        if not all(option_lists):
+            raise ValueError("No valid decision options generated")
+        
+        # Every context's options as one flat array set for the active framework
+        options = [option for context_options in option_lists for option in context_options]
+        utility, risk, confidence = self._options_to_soa(options)
+        utility, confidence = self._active_evaluate_arrays(utility, risk, confidence)
+        self._write_back_soa(options, utility, confidence)
+        scores = self._calculate_option_scores(utility, risk, confidence)
+        
+        # Scores laid out as a (contexts, options) grid padded with -inf, so padding never wins the argmax
+        counts = np.fromiter(map(len, option_lists), dtype=np.intp, count=len(option_lists))
+        grid = np.full((len(option_lists), int(counts.max())), -np.inf)
+        grid[np.arange(grid.shape[1]) < counts[:, np.newaxis]] = scores
+        offsets = np.cumsum(counts) - counts
+        
+        selected_options = [options[i] for i in (offsets + grid.argmax(axis=1)).tolist()]
+        for context, selected_option in zip(contexts, selected_options):
+            self._record_decision(context, selected_option)
+        
+        return selected_options
+
+    def _record_decision(self, context: DecisionContext, selected_option: DecisionOption):
+        """Append a decision to the bounded history and index it by option id"""
+        record = {
             'timestamp': datetime.now(),
             'context': context,
             'decision': selected_option,
-            'framework': self.active_framework
-        })
-        
-        self.performance_metrics['decisions_made'] += 1
+            'framework': self._active_framework
+        }
         
-        print(f"✅ Decision made: {selected_option.option_id} with confidence {selected_option.confidence:.3f}")
+        # The oldest record falls out of the bounded history; unindex it unless a newer one took its place
+        if len(self.decision_history) == self.decision_history.maxlen:
+            evicted = self.decision_history[0]
+            evicted_id = evicted['decision'].option_id
+            if self._decision_index.get(evicted_id) is evicted:
+                del self._decision_index[evicted_id]
+        self.decision_history.append(record)
+        self._decision_index[selected_option.option_id] = record
         
-        return selected_option
+        self.performance_metrics['decisions_made'] += 1
 
-    async def _generate_decision_options(self, context: DecisionContext) -> List[DecisionOption]:
+    def _generate_decision_options(self, context: DecisionContext) -> List[DecisionOption]:
         """Generate possible decision options based on context"""
-        options = []
-        
         # Market regime analysis
         market_regime = context.market_conditions.get('regime', 'neutral')
         volatility = context.market_conditions.get('volatility', 0.2)
         
-        # Option 1: Aggressive arbitrage (high risk, high reward)
-        if volatility > 0.15 and market_regime in ['volatile', 'transition']:
-            aggressive_option = DecisionOption(
-                option_id="aggressive_arbitrage",
-                description="High-frequency arbitrage in volatile market",
-                action_plan={
-                    'strategy': 'aggressive_arbitrage',
-                    'position_size': self.risk_parameters['position_size_limit'] * 0.8,
-                    'profit_target': self.risk_parameters['profit_threshold'] * 2,
-                    'stop_loss': self.risk_parameters['max_drawdown_tolerance'] * 0.5
-                },
-                expected_utility=0.0,
-                risk_metrics={'volatility_exposure': 0.8, 'liquidity_risk': 0.6},
-                confidence=0.0
-            )
-            options.append(aggressive_option)
-        
-        # Option 2: Conservative arbitrage (low risk, steady profit)
-        conservative_option = DecisionOption(
-            option_id="conservative_arbitrage",
-            description="Conservative cross-chain arbitrage",
-            action_plan={
-                'strategy': 'conservative_arbitrage',
-                'position_size': self.risk_parameters['position_size_limit'] * 0.4,
-                'profit_target': self.risk_parameters['profit_threshold'],
-                'stop_loss': self.risk_parameters['max_drawdown_tolerance'] * 0.3
-            },
-            expected_utility=0.0,
-            risk_metrics={'volatility_exposure': 0.3, 'liquidity_risk': 0.2},
-            confidence=0.0
+        build = self._option_builders.get(market_regime, self._default_option_builder)
+        return build(volatility)
+
+    def _make_option_builder(self, market_regime: Optional[str]) -> Callable[[float], List[DecisionOption]]:
+        """Option generator for one market regime, taking the market volatility"""
+        # (option_id, description, action_plan, risk_metrics, regimes offered in, volatility it must exceed)
+        strategies = (
+            # Option 1: Aggressive arbitrage (high risk, high reward)
+            ("aggressive_arbitrage", "High-frequency arbitrage in volatile market", self._aggressive_plan,
+             MappingProxyType({'volatility_exposure': 0.8, 'liquidity_risk': 0.6}), ('volatile', 'transition'), 0.15),
+            # Option 2: Conservative arbitrage (low risk, steady profit)
+            ("conservative_arbitrage", "Conservative cross-chain arbitrage", self._conservative_plan,
+             MappingProxyType({'volatility_exposure': 0.3, 'liquidity_risk': 0.2}), None, None),
+            # Option 3: Market making (steady income)
+            ("market_making", "Automated market making strategy", self._market_making_plan,
+             MappingProxyType({'inventory_risk': 0.5, 'impermanent_loss_risk': 0.4}), ('stable', 'bull'), None)
+        )
+        
+        # Expected utility depends only on the strategy and regime, so it is fixed per builder
+        offered = tuple(
+            (option_id, description, action_plan, risk_metrics,
+             self._calculate_expected_utility(option_id, market_regime), min_volatility)
+            for option_id, description, action_plan, risk_metrics, regimes, min_volatility in strategies
+            if regimes is None or market_regime in regimes
         )
-        options.append(conservative_option)
-        
-        # Option 3: Market making (steady income)
-        if market_regime in ['stable', 'bull']:
-            market_making_option = DecisionOption(
-                option_id="market_making",
-                description="Automated market making strategy",
-                action_plan={
-                    'strategy': 'market_making',
-                    'position_size': self.risk_parameters['position_size_limit'] * 0.6,
-                    'spread_target': 0.002,
-                    'inventory_management': 'dynamic'
-                },
-                expected_utility=0.0,
-                risk_metrics={'inventory_risk': 0.5, 'impermanent_loss_risk': 0.4},
-                confidence=0.0
-            )
-            options.append(market_making_option)
-        
-        # Calculate metrics for each option
-        for option in options:
-            option.expected_utility = await self._calculate_expected_utility(option, context)
-            option.confidence = await self._calculate_confidence(option, context)
         
+        def build(volatility: float) -> List[DecisionOption]:
+            options = []
+            for option_id, description, action_plan, risk_metrics, expected_utility, min_volatility in offered:
+                if min_volatility is not None and not volatility > min_volatility:
+                    continue
+                option = DecisionOption(
+                    option_id=option_id,
+                    description=description,
+                    action_plan=action_plan,
+                    expected_utility=expected_utility,
+                    risk_metrics=risk_metrics,
+                    confidence=0.0
+                )
+                option.confidence = self._calculate_confidence(option, volatility)
+                options.append(option)
+            return options
+        
+        return build
+
+    @staticmethod
+    def _options_to_soa(options: List[DecisionOption]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Struct-of-arrays view of the options: utility, mean risk and confidence vectors"""
+        n = len(options)
+        utility = np.fromiter((option.expected_utility for option in options), dtype=np.float64, count=n)
+        # Options carry different risk metrics, so each contributes its precomputed mean
+        risk = np.fromiter((option._risk_mean for option in options), dtype=np.float64, count=n)
+        confidence = np.fromiter((option.confidence for option in options), dtype=np.float64, count=n)
+        return utility, risk, confidence
+
+    @staticmethod
+    def _write_back_soa(options: List[DecisionOption], utility: np.ndarray, confidence: np.ndarray):
+        """Store evaluated utility and confidence vectors back on their options"""
+        for option, option_utility, option_confidence in zip(options, utility.tolist(), confidence.tolist()):
+            option.expected_utility = option_utility
+            option.confidence = option_confidence
+
+    def _evaluate_options(self, options: List[DecisionOption], evaluate_arrays) -> List[DecisionOption]:
+        """Run a framework's array evaluation over the options and store the results on them"""
+        utility, risk, confidence = self._options_to_soa(options)
+        self._write_back_soa(options, *evaluate_arrays(utility, risk, confidence))
         return options
 
-    async def _evaluate_utility_maximization(self, options: List[DecisionOption], context: DecisionContext) -> List[DecisionOption]:
+    def _evaluate_utility_maximization(self, options: List[DecisionOption], context: DecisionContext) -> List[DecisionOption]:
         """Evaluate options using utility maximization framework"""
-        evaluated_options = []
-        
-        for option in options:
-            # Risk-adjusted utility calculation
-            risk_adjustment = 1.0 - sum(option.risk_metrics.values()) / len(option.risk_metrics)
-            risk_adjusted_utility = option.expected_utility * risk_adjustment
-            
-            # Apply time preference (future utility discount)
-            time_preference = 0.95
-            discounted_utility = risk_adjusted_utility * time_preference
-            
-            option.expected_utility = discounted_utility
-            evaluated_options.append(option)
-        
-        return evaluated_options
-
-    async def _evaluate_prospect_theory(self, options: List[DecisionOption], context: DecisionContext) -> List[DecisionOption]:
+        return self._evaluate_options(options, self._utility_maximization_arrays)
+
+    def _evaluate_prospect_theory(self, options: List[DecisionOption], context: DecisionContext) -> List[DecisionOption]:
         """Evaluate options using prospect theory"""
-        evaluated_options = []
+        return self._evaluate_options(options, self._prospect_theory_arrays)
+
+    def _evaluate_bayesian(self, options: List[DecisionOption], context: DecisionContext) -> List[DecisionOption]:
+        """Evaluate options using Bayesian decision theory"""
+        return self._evaluate_options(options, self._bayesian_arrays)
+
+    @staticmethod
+    def _utility_maximization_arrays(utility: np.ndarray, risk: np.ndarray,
+                                     confidence: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Utility maximization over option vectors; returns (utility, confidence)"""
+        # Risk-adjusted utility, discounted by the time preference for future utility
+        time_preference = 0.95
+        return utility * (1.0 - risk) * time_preference, confidence
+
+    @staticmethod
+    def _prospect_theory_arrays(utility: np.ndarray, risk: np.ndarray,
+                                confidence: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Prospect theory over option vectors; returns (utility, confidence)"""
         loss_aversion = 2.25  # Standard loss aversion coefficient
         
-        for option in options:
-            if option.expected_utility >= 0:
-                # Gains domain
-                value = option.expected_utility ** 0.88
-            else:
-                # Losses domain (apply loss aversion)
-                value = -loss_aversion * ((-option.expected_utility) ** 1.0)
-            
-            option.expected_utility = value
-            evaluated_options.append(option)
-        
-        return evaluated_options
+        # Concave value over gains, loss-averse linear value over losses
+        value = np.empty_like(utility)
+        _prospect_value_kernel(utility, loss_aversion, value)
+        return value, confidence
 
-    async def _evaluate_bayesian(self, options: List[DecisionOption], context: DecisionContext) -> List[DecisionOption]:
-        """Evaluate options using Bayesian decision theory"""
-        evaluated_options = []
-        
-        # Prior success rate from history
-        prior_success_rate = self.performance_metrics.get('success_rate', 0.5)
-        
-        for option in options:
-            # Bayesian updating of confidence
-            option_likelihood = option.confidence
-            posterior_confidence = (prior_success_rate * option_likelihood) / (
-                prior_success_rate * option_likelihood + (1 - prior_success_rate) * (1 - option_likelihood)
-            )
-            
-            option.confidence = posterior_confidence
-            option.expected_utility *= posterior_confidence
-            evaluated_options.append(option)
-        
-        return evaluated_options
-
-    def _select_best_option(self, options: List[DecisionOption], context: DecisionContext) -> DecisionOption:
-        """Select the best option from evaluated options"""
+    def _bayesian_arrays(self, utility: np.ndarray, risk: np.ndarray,
+                         likelihood: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Bayesian decision theory over option vectors; returns (utility, confidence)"""
+        # Prior success rate from history, as log-odds
+        prior = min(max(self.performance_metrics.get('success_rate', 0.5), 1e-6), 1.0 - 1e-6)
+        prior_log_odds = math.log(prior) - math.log1p(-prior)
+        
+        # Bayesian updating of every option's confidence in one pass: posterior log-odds = prior + likelihood log-odds
+        posterior = np.empty_like(likelihood)
+        posterior_utility = np.empty_like(utility)
+        _bayes_update_kernel(prior_log_odds, likelihood, utility, posterior, posterior_utility)
+        return posterior_utility, posterior
+
+    def _select_best_option(self, options: List[DecisionOption], context: DecisionContext,
+                            scores: Optional[np.ndarray] = None) -> DecisionOption:
+        """Select the best option from evaluated options, scoring them unless scores are given"""
         if not options:
             raise ValueError("No options available for selection")
         
-        # Multi-criteria decision making
-        scored_options = []
-        
-        for option in options:
-            score = self._calculate_option_score(option, context)
-            scored_options.append((option, score))
+        # Multi-criteria decision making over every option at once
+        if scores is None:
+            utility, risk, confidence = self._options_to_soa(options)
+            scores = self._calculate_option_scores(utility, risk, confidence)
         
         # Select option with highest score
-        best_option, best_score = max(scored_options, key=lambda x: x[1])
+        best = int(scores.argmax())
+        best_option = options[best]
         
-        print(f" Selected option: {best_option.option_id} with score {best_score:.3f}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🎯 Selected option: %s with score %.3f", best_option.option_id, scores[best])
         
         return best_option
 
-    def _calculate_option_score(self, option: DecisionOption, context: DecisionContext) -> float:
-        """Calculate comprehensive score for an option"""
+    @staticmethod
+    def _calculate_option_scores(utility: np.ndarray, risk: np.ndarray, confidence: np.ndarray) -> np.ndarray:
+        """Calculate comprehensive scores for options from their utility, mean risk and confidence vectors"""
         weights = {
             'utility': 0.5,
             'risk': 0.3,
@@ -298,77 +430,78 @@ class DecisionAgent:
         }
         
         # Normalize components
-        utility_score = max(0.0, min(1.0, option.expected_utility * 10))  # Scale utility
+        utility_score = np.clip(utility * 10, 0.0, 1.0)  # Scale utility
         
         # Risk score (higher is better - lower risk)
-        avg_risk = sum(option.risk_metrics.values()) / len(option.risk_metrics)
-        risk_score = 1.0 - avg_risk
+        risk_score = 1.0 - risk
         
-        confidence_score = option.confidence
-        
-        # Calculate weighted score
-        total_score = (
+        # Calculate weighted scores
+        return (
             weights['utility'] * utility_score +
             weights['risk'] * risk_score +
-            weights['confidence'] * confidence_score
+            weights['confidence'] * confidence
         )
-        
-        return total_score
 
-    async def _calculate_expected_utility(self, option: DecisionOption, context: DecisionContext) -> float:
-        """Calculate expected utility for a decision option"""
+    def _calculate_expected_utility(self, option_id: str, market_regime: Optional[str]) -> float:
+        """Calculate expected utility for a decision option under a market regime"""
         base_utility = 0.0
         
         # Calculate based on option type and market conditions
-        if option.option_id == "aggressive_arbitrage":
+        if option_id == "aggressive_arbitrage":
             base_utility = 0.8  # High potential in volatile markets
-        elif option.option_id == "conservative_arbitrage":
+        elif option_id == "conservative_arbitrage":
             base_utility = 0.6  # Steady but lower returns
-        elif option.option_id == "market_making":
+        elif option_id == "market_making":
             base_utility = 0.5  # Consistent but limited upside
         
         # Adjust for market conditions
-        market_regime = context.market_conditions.get('regime', 'neutral')
-        if market_regime == 'volatile' and option.option_id == "aggressive_arbitrage":
+        if market_regime == 'volatile' and option_id == "aggressive_arbitrage":
             base_utility *= 1.3
-        elif market_regime == 'stable' and option.option_id == "market_making":
+        elif market_regime == 'stable' and option_id == "market_making":
             base_utility *= 1.2
         
         return max(-1.0, min(1.0, base_utility))
 
-    async def _calculate_confidence(self, option: DecisionOption, context: DecisionContext) -> float:
-        """Calculate confidence score for an option"""
+    def _calculate_confidence(self, option: DecisionOption, market_volatility: float) -> float:
+        """Calculate confidence score for an option at the given market volatility"""
         base_confidence = 0.7
         
         # Adjust based on risk metrics
-        risk_factor = 1.0 - sum(option.risk_metrics.values()) / len(option.risk_metrics)
+        risk_factor = 1.0 - option._risk_mean
         
         # Market condition adjustment
-        market_volatility = context.market_conditions.get('volatility', 0.2)
         volatility_factor = 1.0 - min(1.0, market_volatility * 2)
         
         confidence = base_confidence * risk_factor * volatility_factor
         
         return max(0.1, min(0.95, confidence))
 
+    @property
+    def active_framework(self) -> DecisionFramework:
+        return self._active_framework
+
+    @active_framework.setter
+    def active_framework(self, framework: DecisionFramework):
+        # Bind the framework's array evaluator once so decisions skip the enum-keyed dict lookups
+        evaluate_arrays = self.decision_frameworks[framework]['evaluate_arrays']
+        self._active_framework = framework
+        self._active_evaluate_arrays = evaluate_arrays
+
     def update_decision_framework(self, new_framework: DecisionFramework):
         """Update the active decision framework"""
-        if new_framework in self.decision_frameworks:
+        try:
             self.active_framework = new_framework
-            print(f" Updated decision framework to: {new_framework.value}")
-        else:
-            raise ValueError(f"Unknown decision framework: {new_framework}")
+        except KeyError:
+            raise ValueError(f"Unknown decision framework: {new_framework}") from None
+        logger.info("🔄 Updated decision framework to: %s", new_framework.value)
 
     async def learn_from_outcome(self, decision_id: str, outcome: Dict[str, Any]):
         """Learn from decision outcomes to improve future decisions"""
-        # Find the decision in history
-        decision_record = next(
-            (d for d in self.decision_history if d['decision'].option_id == decision_id), 
-            None
-        )
+        # Find the latest decision for this option in history
+        decision_record = self._decision_index.get(decision_id)
         
         if not decision_record:
-            print(f"Decision {decision_id} not found in history")
+            logger.warning("Decision %s not found in history", decision_id)
             return
         
         # Calculate decision quality
@@ -378,26 +511,35 @@ class DecisionAgent:
         
         decision_quality = 1.0 - min(1.0, utility_deviation)
         
-        # Update performance metrics
-        self.performance_metrics['avg_decision_quality'] = (
-            (self.performance_metrics['avg_decision_quality'] * self.performance_metrics['decisions_made'] + decision_quality) /
-            (self.performance_metrics['decisions_made'] + 1)
-        )
+        # Update performance metrics over the outcomes learned from
+        self._outcomes_learned += 1
+        delta = decision_quality - self._quality_mean
+        self._quality_mean += delta / self._outcomes_learned
+        self._quality_m2 += delta * (decision_quality - self._quality_mean)
         
         if decision_quality > 0.7:
             self.performance_metrics['successful_decisions'] += 1
         
-        print(f" Learned from decision {decision_id}. Quality: {decision_quality:.3f}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📚 Learned from decision %s. Quality: %.3f", decision_id, decision_quality)
 
     def get_agent_status(self) -> Dict[str, Any]:
         """Get current agent status and performance"""
+        quality_variance = (
+            self._quality_m2 / (self._outcomes_learned - 1) if self._outcomes_learned > 1 else 0.0
+        )
         return {
             'agent_id': self.agent_id,
             'risk_appetite': self.risk_appetite.value,
             'active_framework': self.active_framework.value,
-            'performance_metrics': self.performance_metrics,
+            'performance_metrics': {
+                **self.performance_metrics,
+                'outcomes_learned': self._outcomes_learned,
+                'avg_decision_quality': self._quality_mean,
+                'decision_quality_variance': quality_variance
+            },
             'recent_decisions': len(self.decision_history),
-            'decision_quality': self.performance_metrics['avg_decision_quality']
+            'decision_quality': self._quality_mean
         }
 
 # Example usage
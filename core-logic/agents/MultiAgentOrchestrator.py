@@ -5,16 +5,55 @@ Quantum-Speed Agent Collaboration for Complex Strategy Execution
 """
 
 import asyncio
-import uuid
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, field
+import heapq
+import itertools
+import logging
+import math
+import operator
+import secrets
+import time
+from typing import Dict, List, Optional, Set, Tuple, Any
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from datetime import datetime, timedelta
 import numpy as np
-from collections import defaultdict, deque
+from collections import Counter, defaultdict, deque
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from asyncio import timeout as async_timeout
+except ImportError:  # Python < 3.11
+    from async_timeout import timeout as async_timeout
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Known task types resolved to small int codes at submission; unknown types get -1.
+# The first four codes have dedicated result generators (see _TASK_RESULT_GENERATORS).
+TASK_TYPE_CODES = {task_type: code for code, task_type in enumerate((
+    'strategy_planning',
+    'risk_assessment',
+    'opportunity_detection',
+    'trade_execution',
+    'market_analysis',
+    'anomaly_detection',
+    'pattern_recognition'
+))}
+
+# Expected processing time in seconds, indexed by task type code
+TASK_PROCESSING_TIMES = (2.0, 1.5, 0.5, 0.2, 1.0, 0.8, 1.2)
+
+# Monotonic clock for internal durations and deadlines; what callers see is stamped on the
+# wall clock (epoch seconds) and only turned into datetimes at the API boundary
+_now = time.monotonic
+_wall_now = time.time
+
 class AgentType(Enum):
     DECISION_AGENT = "decision_agent"
     DETECTION_AGENT = "detection_agent"
@@ -34,6 +73,11 @@ class CoordinationMode(Enum):
     COMPETITIVE = "competitive"
     HYBRID = "hybrid"
 
+# Enum member -> value string lookups for results and reports built on hot paths
+_AGENT_TYPE_VALUE = {agent_type: agent_type.value for agent_type in AgentType}
+_STATUS_VALUE = {status: status.value for status in AgentStatus}
+_MODE_VALUE = {mode: mode.value for mode in CoordinationMode}
+
 @dataclass
 class AgentConfig:
     agent_type: AgentType
@@ -46,6 +90,16 @@ class AgentConfig:
         'reliability': 0.3
     })
 
+@dataclass(slots=True)
+class QueuedTask:
+    task_id: str
+    task_type: str
+    input_data: Dict[str, Any]
+    deadline: Optional[float]  # monotonic seconds
+    assigned_at: float  # monotonic seconds
+    priority: int
+    type_code: int = -1
+
 @dataclass
 class AgentState:
     agent_id: str
@@ -54,8 +108,8 @@ class AgentState:
     capabilities: List[str]
     performance_metrics: Dict[str, float]
     resource_usage: Dict[str, float]
-    last_heartbeat: datetime
-    task_queue: List[Dict] = field(default_factory=list)
+    last_heartbeat: float  # monotonic seconds
+    task_queue: Dict[str, QueuedTask] = field(default_factory=dict)
     completed_tasks: int = 0
     failed_tasks: int = 0
 
@@ -69,7 +123,9 @@ class Task:
     deadline: Optional[datetime] = None
     assigned_agent: Optional[str] = None
     status: str = "pending"
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: float = field(default_factory=_now)  # monotonic seconds
+    deadline_at: Optional[float] = None  # deadline on the monotonic clock
+    type_code: int = -1  # see TASK_TYPE_CODES
 
 @dataclass
 class CoordinationResult:
@@ -81,19 +137,75 @@ class CoordinationResult:
     timestamp: datetime
     success: bool = True
 
+def _score_agents_kernel(idx, succ, eff, rel, w_succ, w_eff, w_rel, qlen, maxload,
+                         capability, trust_row_sum, n_agents, out):
+    """Fused collaborative score for the candidate slots in idx, written into out"""
+    for k in range(idx.shape[0]):
+        i = idx[k]
+        performance = succ[i] * w_succ[i] + eff[i] * w_eff[i] + rel[i] * w_rel[i]
+        load = 1.0 - qlen[i] / maxload[i] if maxload[i] > 0 else 1.0
+        
+        if n_agents > 1:
+            trust_mean = trust_row_sum[i] / (n_agents - 1)
+        else:
+            trust_mean = 0.5
+        
+        score = 0.35 * performance + 0.25 * load + 0.25 * capability[k] + 0.15 * trust_mean
+        out[k] = min(1.0, max(0.0, score))
+
+def _weighted_combine_kernel(contributions, confidences, reliabilities):
+    """Confidence x reliability weighted contribution sum and total weight in one pass"""
+    weighted_sum = 0.0
+    total_weight = 0.0
+    for i in range(contributions.shape[0]):
+        weight = confidences[i] * reliabilities[i]
+        weighted_sum += contributions[i] * weight
+        total_weight += weight
+    return weighted_sum, total_weight
+
+if NUMBA_AVAILABLE:
+    _score_agents_kernel = njit(fastmath=True)(_score_agents_kernel)
+    _weighted_combine_kernel = njit(fastmath=True)(_weighted_combine_kernel)
+
 class MultiAgentOrchestrator:
     """
     Advanced multi-agent system orchestrator for QuantumNex
     Manages collaborative-competitive agent interactions with enterprise-grade reliability
     """
     
+    # Per-agent parallel arrays (name -> dtype) that share the trust matrix slot index
+    _AGENT_ARRAYS = {
+        '_succ': np.float64, '_eff': np.float64, '_rel': np.float64,
+        '_qlen': np.float64, '_maxload': np.float64,
+        '_w_succ': np.float64, '_w_eff': np.float64, '_w_rel': np.float64,
+        '_avg_time': np.float64, '_throughput': np.float64,
+        '_active': np.bool_,
+        '_trust_row_sum': np.float64
+    }
+    
+    _RAND_POOL_SIZE = 8192
+    
+    # Completed-task history record; agents are stored by their permanent serial number
+    _HISTORY_SIZE = 10000
+    _HISTORY_DTYPE = np.dtype([
+        ('task_id', 'U16'),
+        ('agent', np.int32),
+        ('success', np.bool_),
+        ('processing_time', np.float32),
+        ('timestamp', np.float64)  # epoch seconds
+    ])
+    
     def __init__(self, coordination_mode: CoordinationMode = CoordinationMode.HYBRID):
         self.coordination_mode = coordination_mode
         self.agents: Dict[str, AgentState] = {}
         self.agent_configs: Dict[str, AgentConfig] = {}
-        self.task_queue: List[Task] = []
+        # Pending tasks: heap of (-priority, sequence, task_id) plus task lookup by id
+        self._task_heap: List[Tuple[int, int, str]] = []
+        self._task_by_id: Dict[str, Task] = {}
+        self._task_seq = itertools.count()
         self.completed_tasks: List[Task] = []
-        self.coordination_history: List[CoordinationResult] = []
+        self.coordination_history: deque = deque(maxlen=10000)  # chronological CoordinationResults
+        self._recent_successes: deque = deque(maxlen=10)  # 1/0 outcome of the last 10 coordinations
         
         self.performance_metrics = {
             'tasks_completed': 0,
@@ -106,7 +218,7 @@ class MultiAgentOrchestrator:
         }
         
         # Agent capability registry
-        self.capability_registry = defaultdict(list)
+        self.capability_registry: Dict[str, Set[str]] = defaultdict(set)
         
         # Learning and adaptation parameters
         self.learning_parameters = {
@@ -117,14 +229,63 @@ class MultiAgentOrchestrator:
             'adaptation_rate': 0.1
         }
         
-        # Trust scores between agents
-        self.trust_scores: Dict[Tuple[str, str], float] = {}
+        # Dense agent slot index: agent_id -> row/column in the per-agent arrays
+        self._agent_idx: Dict[str, int] = {}
+        self._agent_ids: List[str] = []
+        self._agent_capacity = 256
         
-        # Task history for learning
-        self.task_history: deque = deque(maxlen=10000)
+        # Agent counts per status and the ids of ACTIVE agents, kept in step by _set_agent_status
+        self._status_counts: Counter = Counter()
+        self._active_agents: Set[str] = set()
+        
+        # Per-agent entries of the status report, kept current instead of rebuilt on every poll
+        self._agent_summary: Dict[str, Dict[str, Any]] = {}
+        
+        # Trust scores between agents (row = truster, column = trustee, diagonal unused)
+        self.trust_matrix = np.full((self._agent_capacity, self._agent_capacity), 0.5, dtype=np.float32)
+        np.fill_diagonal(self.trust_matrix, 0.0)
+        
+        # Per-agent selection inputs laid out as parallel arrays (one entry per slot)
+        for name, dtype in self._AGENT_ARRAYS.items():
+            setattr(self, name, np.zeros(self._agent_capacity, dtype=dtype))
+        self._score_buf = np.empty(self._agent_capacity)
+        
+        # Capability bitmasks: each capability gets a bit id, each slot a row of 64-bit words
+        self._cap_id: Dict[str, int] = {}
+        self._cap_mask = np.zeros((self._agent_capacity, 1), dtype=np.uint64)
+        
+        # Task history for learning, kept as a ring buffer of structured records
+        self._history = np.zeros(self._HISTORY_SIZE, dtype=self._HISTORY_DTYPE)
+        self._history_pos = 0
+        self._history_count = 0
+        
+        # Permanent agent serial numbers so history records outlive slot reuse
+        self._agent_serials: Dict[str, int] = {}
+        self._serial_agent_ids: List[str] = []
+        
+        # Agents behind the last 20 completed tasks, with per-agent counts over that window
+        self._recent_task_agents: deque = deque(maxlen=20)
+        self._recent_task_counts: Counter = Counter()
+        
+        # Processing times of the last 100 completed tasks, with a running sum/count of the positive ones
+        self._recent_proc_times: deque = deque(maxlen=100)
+        self._proc_time_sum = 0.0
+        self._proc_time_count = 0
+        
+        # Pre-drawn uniform [0, 1) block consumed by the per-task simulation draws
+        self._rng = np.random.default_rng()
+        self._rand_pool: List[float] = self._rng.random(self._RAND_POOL_SIZE).tolist()
+        self._rand_i = 0
         
         self.is_running = False
         self._monitor_task = None
+        
+        # Strong references to every background task so none is garbage collected mid-flight
+        self._background: Set[asyncio.Task] = set()
+        
+        # Task assignment runs in one loop woken by submissions and freed capacity
+        self._assign_event = asyncio.Event()
+        self._assigner_task = None
         print("✅ Multi-Agent Orchestrator initialized")
 
     async def initialize(self):
@@ -137,10 +298,13 @@ class MultiAgentOrchestrator:
             
             # Start agent monitoring
             self.is_running = True
-            self._monitor_task = asyncio.create_task(self._monitor_agents())
+            self._monitor_task = self._spawn(self._monitor_agents())
+            
+            # Start task assignment
+            self._start_assigner()
             
             # Start performance optimization
-            asyncio.create_task(self._optimize_system_performance())
+            self._spawn(self._optimize_system_performance())
             
             print("✅ Multi-Agent System initialized successfully")
             
@@ -148,6 +312,13 @@ class MultiAgentOrchestrator:
             print(f"❌ Failed to initialize Multi-Agent System: {e}")
             raise
 
+    def _spawn(self, coro) -> asyncio.Task:
+        """Start a background task that is tracked until it finishes and cancelled on shutdown"""
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        return task
+
     async def _initialize_core_agents(self):
         """Initialize core agent types for QuantumNex with comprehensive capabilities"""
         core_agents = [
@@ -183,7 +354,7 @@ class MultiAgentOrchestrator:
 
     async def create_agent(self, agent_type: AgentType, capabilities: List[str]) -> str:
         """Create and register a new agent with comprehensive configuration"""
-        agent_id = f"{agent_type.value}_{uuid.uuid4().hex[:8]}"
+        agent_id = f"{agent_type.value}_{secrets.token_hex(4)}"
         
         # Determine resource limits based on agent type
         resource_limits = self._get_resource_limits(agent_type)
@@ -217,27 +388,37 @@ class MultiAgentOrchestrator:
                 'active_tasks': 0,
                 'network_usage': 0.0
             },
-            last_heartbeat=datetime.now()
+            last_heartbeat=_now()
         )
         
         # Register agent
         self.agents[agent_id] = agent_state
         self.agent_configs[agent_id] = agent_config
+        self._status_counts[agent_state.status] += 1
+        self._agent_summary[agent_id] = {
+            'type': _AGENT_TYPE_VALUE[agent_type],
+            'status': _STATUS_VALUE[agent_state.status],
+            'capabilities': agent_state.capabilities,
+            'performance': agent_state.performance_metrics,
+            'current_load': 0
+        }
         
         # Update capability registry
         for capability in capabilities:
-            self.capability_registry[capability].append(agent_id)
+            self.capability_registry[capability].add(agent_id)
+        
+        self._agent_serials[agent_id] = len(self._serial_agent_ids)
+        self._serial_agent_ids.append(agent_id)
         
-        # Initialize trust scores with all existing agents
-        for other_agent_id in self.agents:
-            if other_agent_id != agent_id:
-                self.trust_scores[(agent_id, other_agent_id)] = 0.5
-                self.trust_scores[(other_agent_id, agent_id)] = 0.5
+        # Allocate a slot; trust with all existing agents starts neutral
+        self._allocate_agent_slot(agent_id)
+        self._register_capabilities(agent_id, capabilities)
+        self._sync_agent_slot(agent_id)
         
         # Simulate agent initialization with proper error handling
         try:
             await asyncio.sleep(0.05)  # Simulate initialization time
-            agent_state.status = AgentStatus.ACTIVE
+            self._set_agent_status(agent_id, AgentStatus.ACTIVE)
             
             print(f"✅ Created agent: {agent_id} with capabilities: {capabilities}")
             
@@ -245,9 +426,182 @@ class MultiAgentOrchestrator:
             
         except Exception as e:
             print(f"❌ Failed to create agent {agent_id}: {e}")
-            agent_state.status = AgentStatus.ERROR
+            self._set_agent_status(agent_id, AgentStatus.ERROR)
             raise
 
+    def _urand(self) -> float:
+        """Next uniform [0, 1) draw from the pre-drawn pool, refilling it when exhausted"""
+        if self._rand_i >= self._RAND_POOL_SIZE:
+            self._rand_pool = self._rng.random(self._RAND_POOL_SIZE).tolist()
+            self._rand_i = 0
+        value = self._rand_pool[self._rand_i]
+        self._rand_i += 1
+        return value
+
+    def _uniform(self, low: float, high: float) -> float:
+        """Uniform [low, high) draw from the pre-drawn pool"""
+        return low + (high - low) * self._urand()
+
+    def _choice(self, options: Tuple):
+        """Uniformly pick one of the options using the pre-drawn pool"""
+        return options[int(self._urand() * len(options))]
+
+    def _recent_history(self, count: int) -> np.ndarray:
+        """The last count task history records in chronological order"""
+        count = min(count, self._history_count)
+        start = self._history_pos - count
+        if start >= 0:
+            return self._history[start:self._history_pos]
+        # The window wraps around the end of the ring buffer
+        return np.concatenate((self._history[start:], self._history[:self._history_pos]))
+
+    @property
+    def task_history(self) -> List[Dict[str, Any]]:
+        """Completed-task history records in chronological order"""
+        return [
+            {
+                'task_id': str(record['task_id']),
+                'agent_id': self._serial_agent_ids[record['agent']],
+                'success': bool(record['success']),
+                'processing_time': float(record['processing_time']),
+                'timestamp': datetime.fromtimestamp(record['timestamp'])
+            }
+            for record in self._recent_history(self._history_count)
+        ]
+
+    @property
+    def task_queue(self) -> List[Task]:
+        """Pending tasks in assignment order (highest priority first)"""
+        return [self._task_by_id[task_id] for _, _, task_id in sorted(self._task_heap)]
+
+    def _allocate_agent_slot(self, agent_id: str) -> int:
+        """Assign the next dense slot to an agent, growing the per-agent arrays by doubling"""
+        i = len(self._agent_ids)
+        if i >= self._agent_capacity:
+            new_capacity = self._agent_capacity * 2
+            grown = np.full((new_capacity, new_capacity), 0.5, dtype=np.float32)
+            grown[:i, :i] = self.trust_matrix[:i, :i]
+            np.fill_diagonal(grown, 0.0)
+            self.trust_matrix = grown
+            for name, dtype in self._AGENT_ARRAYS.items():
+                array = np.zeros(new_capacity, dtype=dtype)
+                array[:i] = getattr(self, name)[:i]
+                setattr(self, name, array)
+            cap_mask = np.zeros((new_capacity, self._cap_mask.shape[1]), dtype=np.uint64)
+            cap_mask[:i] = self._cap_mask[:i]
+            self._cap_mask = cap_mask
+            self._score_buf = np.empty(new_capacity)
+            self._agent_capacity = new_capacity
+        
+        self.trust_matrix[i, :] = 0.5
+        self.trust_matrix[:, i] = 0.5
+        self.trust_matrix[i, i] = 0.0
+        self._cap_mask[i] = 0
+        
+        # Every existing agent gains one neutral trust entry
+        self._trust_row_sum[:i] += 0.5
+        self._trust_row_sum[i] = 0.5 * i
+        
+        self._agent_idx[agent_id] = i
+        self._agent_ids.append(agent_id)
+        return i
+
+    def _release_agent_slot(self, agent_id: str):
+        """Free an agent's slot by moving the last slot into it to keep the arrays dense"""
+        i = self._agent_idx.pop(agent_id)
+        last = len(self._agent_ids) - 1
+        
+        # Every remaining agent loses its trust entry for the removed agent
+        self._trust_row_sum[:last + 1] -= self.trust_matrix[:last + 1, i]
+        
+        if i != last:
+            moved_id = self._agent_ids[last]
+            self.trust_matrix[i, :] = self.trust_matrix[last, :]
+            self.trust_matrix[:, i] = self.trust_matrix[:, last]
+            self.trust_matrix[i, i] = 0.0
+            for name in self._AGENT_ARRAYS:
+                array = getattr(self, name)
+                array[i] = array[last]
+            self._cap_mask[i] = self._cap_mask[last]
+            self._agent_ids[i] = moved_id
+            self._agent_idx[moved_id] = i
+        
+        self._agent_ids.pop()
+
+    def _sync_agent_slot(self, agent_id: str):
+        """Copy an agent's selection inputs from its state and config into the slot arrays"""
+        i = self._agent_idx[agent_id]
+        agent_state = self.agents[agent_id]
+        agent_config = self.agent_configs[agent_id]
+        metrics = agent_state.performance_metrics
+        
+        self._succ[i] = metrics['success_rate']
+        self._eff[i] = metrics['efficiency_score']
+        self._rel[i] = metrics['reliability_score']
+        self._avg_time[i] = metrics['avg_processing_time']
+        self._throughput[i] = metrics['throughput']
+        self._qlen[i] = len(agent_state.task_queue)
+        self._maxload[i] = agent_config.resource_limits['max_concurrent_tasks']
+        self._w_succ[i] = agent_config.performance_weights['success_rate']
+        self._w_eff[i] = agent_config.performance_weights['efficiency']
+        self._w_rel[i] = agent_config.performance_weights['reliability']
+        self._active[i] = agent_state.status == AgentStatus.ACTIVE
+
+    def _set_agent_status(self, agent_id: str, status: AgentStatus):
+        """Set an agent's status and keep the active-slot mask and status counts in step"""
+        agent_state = self.agents[agent_id]
+        self._status_counts[agent_state.status] -= 1
+        self._status_counts[status] += 1
+        agent_state.status = status
+        self._agent_summary[agent_id]['status'] = _STATUS_VALUE[status]
+        is_active = status == AgentStatus.ACTIVE
+        self._active[self._agent_idx[agent_id]] = is_active
+        if is_active:
+            self._active_agents.add(agent_id)
+        else:
+            self._active_agents.discard(agent_id)
+
+    def _register_capabilities(self, agent_id: str, capabilities: List[str]):
+        """Assign bit ids to new capabilities and set them in the agent's capability mask"""
+        i = self._agent_idx[agent_id]
+        for capability in capabilities:
+            cap_id = self._cap_id.setdefault(capability, len(self._cap_id))
+            word, bit = divmod(cap_id, 64)
+            if word >= self._cap_mask.shape[1]:
+                # Widen every mask by one 64-bit word
+                self._cap_mask = np.hstack([self._cap_mask, np.zeros((self._agent_capacity, 1), dtype=np.uint64)])
+            self._cap_mask[i, word] |= np.uint64(1 << bit)
+
+    def _requirements_mask(self, requirements: List[str]) -> Optional[np.ndarray]:
+        """Capability bitmask covering the known requirements, or None if none are registered"""
+        mask = np.zeros(self._cap_mask.shape[1], dtype=np.uint64)
+        found = False
+        for requirement in requirements:
+            cap_id = self._cap_id.get(requirement)
+            if cap_id is not None:
+                word, bit = divmod(cap_id, 64)
+                mask[word] |= np.uint64(1 << bit)
+                found = True
+        return mask if found else None
+
+    def _trust_means(self, idx: np.ndarray) -> np.ndarray:
+        """Average trust each given agent slot has in every other registered agent, active or not"""
+        n = len(self._agent_ids)
+        if n <= 1:
+            return np.full(len(idx), 0.5)
+        # Diagonal is held at zero, so the row sum only covers other agents
+        return self._trust_row_sum[idx] / (n - 1)
+
+    @property
+    def trust_scores(self) -> Dict[Tuple[str, str], float]:
+        """Pairwise trust scores keyed by (agent_id, other_agent_id)"""
+        return {
+            (agent_id, other_id): float(self.trust_matrix[i, j])
+            for agent_id, i in self._agent_idx.items()
+            for other_id, j in self._agent_idx.items()
+            if i != j
+        }
+
     def _get_resource_limits(self, agent_type: AgentType) -> Dict[str, float]:
         """Get appropriate resource limits based on agent type"""
         base_limits = {
@@ -283,7 +637,7 @@ class MultiAgentOrchestrator:
         if not input_data:
             raise ValueError("Task must have input data")
         
-        task_id = f"TASK_{uuid.uuid4().hex[:8]}"
+        task_id = f"TASK_{secrets.token_hex(4)}"
         
         task = Task(
             task_id=task_id,
@@ -291,30 +645,58 @@ class MultiAgentOrchestrator:
             priority=max(1, min(10, priority)),  # Clamp priority between 1-10
             requirements=requirements,
             input_data=input_data,
-            deadline=deadline
+            deadline=deadline,
+            type_code=TASK_TYPE_CODES.get(task_type, -1)
         )
+        if deadline is not None:
+            # Resolve the wall-clock deadline onto the monotonic clock once
+            task.deadline_at = task.created_at + (deadline - datetime.now()).total_seconds()
         
-        # Add to task queue with priority sorting
-        self.task_queue.append(task)
-        self.task_queue.sort(key=lambda x: (x.priority, x.created_at), reverse=True)
+        # Add to priority queue (highest priority first, FIFO within a priority)
+        self._task_by_id[task_id] = task
+        heapq.heappush(self._task_heap, (-task.priority, next(self._task_seq), task_id))
         
-        print(f"📥 Submitted task: {task_id} - Type: {task_type} - Priority: {priority}")
+        logger.info("📥 Submitted task: %s - Type: %s - Priority: %s", task_id, task_type, priority)
         
-        # Trigger asynchronous task assignment
-        asyncio.create_task(self._assign_tasks())
+        # Wake the assignment loop (started here if initialize() hasn't run); bursts of
+        # submissions coalesce into one pass
+        self._start_assigner()
+        self._assign_event.set()
         
         return task_id
 
-    async def _assign_tasks(self):
-        """Assign tasks to appropriate agents with load balancing"""
-        if not self.task_queue:
-            return
+    def _start_assigner(self):
+        """Start the task assignment loop unless it is already running"""
+        if self._assigner_task is None or self._assigner_task.done():
+            self._assigner_task = self._spawn(self._assignment_loop())
+
+    async def _assignment_loop(self):
+        """Assign queued tasks whenever tasks are submitted or agent capacity frees up (until cancelled)"""
+        while True:
+            await self._assign_event.wait()
+            self._assign_event.clear()
+            
+            try:
+                # Keep draining while passes make progress, yielding between passes
+                while self._task_heap and await self._assign_tasks():
+                    await asyncio.sleep(0)
+            except Exception as e:
+                logger.error("❌ Error in task assignment loop: %s", e)
+
+    async def _assign_tasks(self) -> int:
+        """Assign tasks to appropriate agents with load balancing, returning how many left the queue"""
+        if not self._task_heap:
+            return 0
         
         assigned_tasks = []
-        max_assignments_per_cycle = min(10, len(self.task_queue))
+        deferred_entries = []
+        max_assignments_per_cycle = min(10, len(self._task_heap))
         
-        for task in self.task_queue[:max_assignments_per_cycle]:
+        for _ in range(max_assignments_per_cycle):
+            entry = heapq.heappop(self._task_heap)
+            task = self._task_by_id[entry[2]]
             if task.status != "pending":
+                del self._task_by_id[task.task_id]
                 continue
             
             try:
@@ -330,62 +712,66 @@ class MultiAgentOrchestrator:
                         task.status = "assigned"
                         
                         # Add to agent's task queue with metadata
-                        self.agents[selected_agent].task_queue.append({
-                            'task_id': task.task_id,
-                            'task_type': task.task_type,
-                            'input_data': task.input_data,
-                            'deadline': task.deadline,
-                            'assigned_at': datetime.now(),
-                            'priority': task.priority
-                        })
+                        self.agents[selected_agent].task_queue[task.task_id] = QueuedTask(
+                            task_id=task.task_id,
+                            task_type=task.task_type,
+                            input_data=task.input_data,
+                            deadline=task.deadline_at,
+                            assigned_at=_now(),
+                            priority=task.priority,
+                            type_code=task.type_code
+                        )
+                        
+                        self._qlen[self._agent_idx[selected_agent]] += 1
                         
                         assigned_tasks.append(task)
-                        print(f"🎯 Assigned task {task.task_id} to agent {selected_agent}")
+                        logger.info("🎯 Assigned task %s to agent %s", task.task_id, selected_agent)
                 
                 else:
                     # No suitable agents found
-                    if task.deadline and task.deadline < datetime.now():
+                    if task.deadline_at is not None and task.deadline_at < _now():
                         task.status = "expired"
                         assigned_tasks.append(task)
-                        print(f"⏰ Task {task.task_id} expired before assignment")
+                        logger.info("⏰ Task %s expired before assignment", task.task_id)
                         
             except Exception as e:
-                print(f"❌ Error assigning task {task.task_id}: {e}")
+                logger.error("❌ Error assigning task %s: %s", task.task_id, e)
                 task.status = "error"
                 assigned_tasks.append(task)
+            
+            # Keep unassigned tasks queued; drop assigned/expired/error tasks
+            if task.status == "pending":
+                deferred_entries.append(entry)
+            else:
+                del self._task_by_id[task.task_id]
         
-        # Remove assigned/expired/error tasks from queue
-        for task in assigned_tasks:
-            if task in self.task_queue:
-                self.task_queue.remove(task)
+        for entry in deferred_entries:
+            heapq.heappush(self._task_heap, entry)
         
         # Process assigned tasks
         for task in assigned_tasks:
             if task.status == "assigned" and task.assigned_agent:
-                asyncio.create_task(self._process_agent_task(task.assigned_agent, task.task_id))
+                self._spawn(self._process_agent_task(task.assigned_agent, task.task_id))
+        
+        return len(assigned_tasks)
 
     def _find_suitable_agents(self, task: Task) -> List[str]:
         """Find agents suitable for the task requirements with capacity checking"""
-        suitable_agents = set()
+        requirements_mask = self._requirements_mask(task.requirements)
+        if requirements_mask is None:
+            return []
         
-        # Find agents with required capabilities
-        for requirement in task.requirements:
-            if requirement in self.capability_registry:
-                suitable_agents.update(self.capability_registry[requirement])
+        n = len(self._agent_ids)
         
-        if not suitable_agents:
-            return []
+        # Agents with at least one required capability
+        eligible = (self._cap_mask[:n] & requirements_mask).any(axis=1)
         
         # Filter by agent status, capacity, and health
-        suitable_agents = [
-            agent_id for agent_id in suitable_agents
-            if (self.agents[agent_id].status == AgentStatus.ACTIVE and
-                len(self.agents[agent_id].task_queue) < 
-                self.agent_configs[agent_id].resource_limits['max_concurrent_tasks'] and
-                self.agents[agent_id].performance_metrics['reliability_score'] > 0.3)
-        ]
+        eligible &= self._active[:n]
+        eligible &= self._qlen[:n] < self._maxload[:n]
+        eligible &= self._rel[:n] > 0.3
         
-        return suitable_agents
+        return [self._agent_ids[i] for i in np.flatnonzero(eligible)]
 
     def _select_agent_for_task(self, task: Task, suitable_agents: List[str]) -> Optional[str]:
         """Select the best agent for the task based on coordination mode and performance"""
@@ -395,6 +781,9 @@ class MultiAgentOrchestrator:
         if len(suitable_agents) == 1:
             return suitable_agents[0]
         
+        if len(suitable_agents) == 2:
+            return self._select_agent_pair(*suitable_agents)
+        
         if self.coordination_mode == CoordinationMode.COLLABORATIVE:
             return self._select_agent_collaborative(task, suitable_agents)
         elif self.coordination_mode == CoordinationMode.COMPETITIVE:
@@ -402,48 +791,61 @@ class MultiAgentOrchestrator:
         else:  # HYBRID
             return self._select_agent_hybrid(task, suitable_agents)
 
+    def _select_agent_pair(self, agent_a: str, agent_b: str) -> str:
+        """Pick between two candidates on success rate penalized by queue length"""
+        ia, ib = self._agent_idx[agent_a], self._agent_idx[agent_b]
+        score_a = self._succ[ia] - 0.1 * self._qlen[ia]
+        score_b = self._succ[ib] - 0.1 * self._qlen[ib]
+        
+        if self.coordination_mode == CoordinationMode.COMPETITIVE:
+            # One ±10% bid variation keeps some exploration between the pair
+            score_a *= self._uniform(0.9, 1.1)
+        
+        return agent_a if score_a >= score_b else agent_b
+
     def _select_agent_collaborative(self, task: Task, agents: List[str]) -> str:
         """Select agent collaboratively considering overall system efficiency"""
-        agent_scores = {}
-        
-        for agent_id in agents:
-            agent_state = self.agents[agent_id]
-            agent_config = self.agent_configs[agent_id]
-            
-            # Performance score (weighted combination)
-            metrics = agent_state.performance_metrics
-            performance_score = (
-                metrics['success_rate'] * agent_config.performance_weights['success_rate'] +
-                metrics['efficiency_score'] * agent_config.performance_weights['efficiency'] +
-                metrics['reliability_score'] * agent_config.performance_weights['reliability']
-            )
-            
-            # Load score (prefer less loaded agents)
-            current_load = len(agent_state.task_queue)
-            max_load = agent_config.resource_limits['max_concurrent_tasks']
-            load_score = 1 - (current_load / max_load) if max_load > 0 else 1.0
-            
-            # Capability match score
-            capability_match = len(set(task.requirements) & set(agent_state.capabilities))
-            capability_score = capability_match / len(task.requirements)
-            
-            # Trust score (average trust with other agents)
-            trust_score = np.mean([
-                self.trust_scores.get((agent_id, other_id), 0.5)
-                for other_id in self.agents if other_id != agent_id
-            ])
-            
-            # Combined collaborative score
-            total_score = (
-                performance_score * 0.35 +
-                load_score * 0.25 +
-                capability_score * 0.25 +
-                trust_score * 0.15
-            )
-            
-            agent_scores[agent_id] = max(0.0, min(1.0, total_score))
+        idx = np.fromiter((self._agent_idx[agent_id] for agent_id in agents), dtype=np.intp, count=len(agents))
+        
+        # Capability match score
+        requirements = set(task.requirements)
+        capability_score = np.fromiter(
+            (len(requirements.intersection(self.agents[agent_id].capabilities)) for agent_id in agents),
+            dtype=np.float64, count=len(agents)
+        ) / len(task.requirements)
+        
+        if NUMBA_AVAILABLE:
+            total_score = self._score_buf[:len(idx)]
+            _score_agents_kernel(idx, self._succ, self._eff, self._rel, self._w_succ, self._w_eff,
+                                 self._w_rel, self._qlen, self._maxload, capability_score,
+                                 self._trust_row_sum, len(self._agent_ids), total_score)
+        else:
+            total_score = self._score_agents_numpy(idx, capability_score)
         
-        return max(agent_scores.items(), key=lambda x: x[1])[0]
+        return agents[int(total_score.argmax())]
+
+    def _score_agents_numpy(self, idx: np.ndarray, capability_score: np.ndarray) -> np.ndarray:
+        """Collaborative score for the candidate slots in idx using NumPy array operations"""
+        # Performance score (weighted combination)
+        performance_score = (self._succ[idx] * self._w_succ[idx] +
+                             self._eff[idx] * self._w_eff[idx] +
+                             self._rel[idx] * self._w_rel[idx])
+        
+        # Load score (prefer less loaded agents)
+        max_load = self._maxload[idx]
+        load_score = 1 - np.divide(self._qlen[idx], max_load, out=np.zeros(len(idx)), where=max_load > 0)
+        
+        # Trust score (average trust with other agents)
+        trust_score = self._trust_means(idx)
+        
+        # Combined collaborative score
+        return np.clip(
+            performance_score * 0.35 +
+            load_score * 0.25 +
+            capability_score * 0.25 +
+            trust_score * 0.15,
+            0.0, 1.0
+        )
 
     def _select_agent_competitive(self, task: Task, agents: List[str]) -> str:
         """Select agent competitively (auction-based selection)"""
@@ -459,7 +861,7 @@ class MultiAgentOrchestrator:
             
             # Competitive bid with some randomness for exploration
             base_bid = performance * capability_match * efficiency
-            bid_variation = np.random.uniform(0.9, 1.1)  # ±10% variation
+            bid_variation = self._uniform(0.9, 1.1)  # ±10% variation
             bid = base_bid * bid_variation * (task.priority / 10.0)
             
             bids[agent_id] = bid
@@ -480,47 +882,47 @@ class MultiAgentOrchestrator:
             competitive_score = self._select_agent_competitive(task, agents)
             
             # Prefer collaborative for better system health, but allow some competition
-            return collaborative_score if np.random.random() > 0.3 else competitive_score
+            return collaborative_score if self._urand() > 0.3 else competitive_score
 
     async def _process_agent_task(self, agent_id: str, task_id: str):
         """Process a task assigned to an agent with comprehensive error handling"""
         if agent_id not in self.agents:
-            print(f"❌ Agent {agent_id} not found for task {task_id}")
+            logger.warning("❌ Agent %s not found for task %s", agent_id, task_id)
             return
         
         agent_state = self.agents[agent_id]
-        start_time = datetime.now()
+        start_time = _now()
         
         try:
             # Find the task in agent's queue
-            task_item = next((t for t in agent_state.task_queue if t['task_id'] == task_id), None)
-            if not task_item:
-                print(f"❌ Task {task_id} not found in agent {agent_id} queue")
+            task_item = agent_state.task_queue.get(task_id)
+            if task_item is None:
+                logger.warning("❌ Task %s not found in agent %s queue", task_id, agent_id)
                 return
             
             # Update agent resource usage
             agent_state.resource_usage['active_tasks'] += 1
             
             # Simulate task processing with variable complexity
-            base_processing_time = self._calculate_processing_time(task_item['task_type'])
-            processing_time = base_processing_time * np.random.uniform(0.8, 1.2)
+            base_processing_time = self._calculate_processing_time(task_item.type_code)
+            processing_time = base_processing_time * self._uniform(0.8, 1.2)
             
             await asyncio.sleep(min(processing_time, 5.0))  # Cap at 5 seconds for simulation
             
             # Determine success based on agent reliability and task complexity
             success_probability = agent_state.performance_metrics['reliability_score']
-            success = np.random.random() < success_probability
+            success = self._urand() < success_probability
             
             # Generate comprehensive task result
             result_data = {
                 'success': success,
                 'processing_time': processing_time,
-                'result': self._generate_task_result(task_item['task_type'], success),
+                'result': self._generate_task_result(task_item.type_code, success),
                 'timestamp': datetime.now(),
                 'agent_id': agent_id,
                 'resource_usage': {
-                    'cpu': np.random.uniform(0.1, 0.5),
-                    'memory': np.random.uniform(10, 100)
+                    'cpu': self._uniform(0.1, 0.5),
+                    'memory': self._uniform(10, 100)
                 }
             }
             
@@ -534,7 +936,7 @@ class MultiAgentOrchestrator:
             await self._handle_task_completion(agent_id, task_id, result_data, start_time)
             
         except asyncio.CancelledError:
-            print(f"⚠️ Task {task_id} processing cancelled for agent {agent_id}")
+            logger.warning("⚠️ Task %s processing cancelled for agent %s", task_id, agent_id)
             await self._handle_task_completion(agent_id, task_id, {
                 'success': False,
                 'error': 'Task cancelled',
@@ -542,7 +944,7 @@ class MultiAgentOrchestrator:
             }, start_time)
             
         except Exception as e:
-            print(f"❌ Error processing task {task_id} by agent {agent_id}: {e}")
+            logger.error("❌ Error processing task %s by agent %s: %s", task_id, agent_id, e)
             await self._handle_task_completion(agent_id, task_id, {
                 'success': False,
                 'error': str(e),
@@ -557,74 +959,101 @@ class MultiAgentOrchestrator:
                 
             # Remove from agent's queue
             if agent_id in self.agents:
-                agent_state.task_queue = [t for t in agent_state.task_queue if t['task_id'] != task_id]
-
-    def _calculate_processing_time(self, task_type: str) -> float:
-        """Calculate expected processing time based on task type"""
-        processing_times = {
-            'strategy_planning': 2.0,
-            'risk_assessment': 1.5,
-            'opportunity_detection': 0.5,
-            'trade_execution': 0.2,
-            'market_analysis': 1.0,
-            'anomaly_detection': 0.8,
-            'pattern_recognition': 1.2
-        }
-        return processing_times.get(task_type, 1.0)
+                agent_state.task_queue.pop(task_id, None)
+                self._qlen[self._agent_idx[agent_id]] = len(agent_state.task_queue)
+            
+            # Freed capacity may let queued tasks be assigned
+            if self._task_heap:
+                self._assign_event.set()
 
-    def _generate_task_result(self, task_type: str, success: bool) -> Dict[str, Any]:
-        """Generate realistic task results based on task type and success"""
+    def _calculate_processing_time(self, type_code: int) -> float:
+        """Calculate expected processing time based on task type code"""
+        return TASK_PROCESSING_TIMES[type_code] if type_code >= 0 else 1.0
+
+    def _generate_task_result(self, type_code: int, success: bool) -> Dict[str, Any]:
+        """Generate realistic task results based on task type code and success"""
         if not success:
             return {'error': 'Task execution failed', 'recommendation': 'retry'}
         
-        base_results = {
-            'strategy_planning': {
-                'recommended_action': 'BUY' if np.random.random() > 0.5 else 'SELL',
-                'confidence': np.random.uniform(0.7, 0.95),
-                'time_horizon': np.random.choice(['SHORT', 'MEDIUM', 'LONG'])
-            },
-            'risk_assessment': {
-                'risk_level': np.random.choice(['LOW', 'MEDIUM', 'HIGH']),
-                'max_drawdown': np.random.uniform(0.01, 0.1),
-                'var_95': np.random.uniform(0.02, 0.15)
-            },
-            'opportunity_detection': {
-                'opportunity_type': np.random.choice(['ARBITRAGE', 'MOMENTUM', 'MEAN_REVERSION']),
-                'expected_return': np.random.uniform(0.005, 0.05),
-                'time_window_minutes': np.random.randint(1, 30)
-            },
-            'trade_execution': {
-                'executed_price': np.random.uniform(100, 500),
-                'slippage': np.random.uniform(0.001, 0.01),
-                'fill_rate': np.random.uniform(0.8, 1.0)
-            }
-        }
+        if 0 <= type_code < len(self._TASK_RESULT_GENERATORS):
+            return self._TASK_RESULT_GENERATORS[type_code](self)
         
-        return base_results.get(task_type, {'status': 'completed', 'details': 'Task executed successfully'})
+        return {'status': 'completed', 'details': 'Task executed successfully'}
+
+    def _strategy_planning_result(self) -> Dict[str, Any]:
+        return {
+            'recommended_action': 'BUY' if self._urand() > 0.5 else 'SELL',
+            'confidence': self._uniform(0.7, 0.95),
+            'time_horizon': self._choice(('SHORT', 'MEDIUM', 'LONG'))
+        }
+
+    def _risk_assessment_result(self) -> Dict[str, Any]:
+        return {
+            'risk_level': self._choice(('LOW', 'MEDIUM', 'HIGH')),
+            'max_drawdown': self._uniform(0.01, 0.1),
+            'var_95': self._uniform(0.02, 0.15)
+        }
 
-    async def _handle_task_completion(self, agent_id: str, task_id: str, result: Dict, start_time: datetime = None):
+    def _opportunity_detection_result(self) -> Dict[str, Any]:
+        return {
+            'opportunity_type': self._choice(('ARBITRAGE', 'MOMENTUM', 'MEAN_REVERSION')),
+            'expected_return': self._uniform(0.005, 0.05),
+            'time_window_minutes': 1 + int(self._urand() * 29)
+        }
+
+    def _trade_execution_result(self) -> Dict[str, Any]:
+        return {
+            'executed_price': self._uniform(100, 500),
+            'slippage': self._uniform(0.001, 0.01),
+            'fill_rate': self._uniform(0.8, 1.0)
+        }
+
+    # Result generators indexed by task type code
+    _TASK_RESULT_GENERATORS = (
+        _strategy_planning_result,
+        _risk_assessment_result,
+        _opportunity_detection_result,
+        _trade_execution_result
+    )
+
+    async def _handle_task_completion(self, agent_id: str, task_id: str, result: Dict, start_time: float = None):
         """Handle task completion and update system state comprehensively"""
-        completion_time = (datetime.now() - start_time).total_seconds() if start_time else 0
+        completion_time = _now() - start_time if start_time else 0
         
         if result['success']:
             self.performance_metrics['tasks_completed'] += 1
             if agent_id in self.agents:
                 self.agents[agent_id].completed_tasks += 1
-            print(f"✅ Task {task_id} completed successfully by agent {agent_id} in {completion_time:.2f}s")
+            logger.info("✅ Task %s completed successfully by agent %s in %.2fs", task_id, agent_id, completion_time)
         else:
             self.performance_metrics['tasks_failed'] += 1
             if agent_id in self.agents:
                 self.agents[agent_id].failed_tasks += 1
-            print(f"❌ Task {task_id} failed by agent {agent_id}. Error: {result.get('error', 'Unknown')}")
+            logger.info("❌ Task %s failed by agent %s. Error: %s", task_id, agent_id, result.get('error', 'Unknown'))
+        
+        # Track which agents completed the most recent tasks
+        if len(self._recent_task_agents) == self._recent_task_agents.maxlen:
+            self._recent_task_counts[self._recent_task_agents[0]] -= 1
+        self._recent_task_agents.append(agent_id)
+        self._recent_task_counts[agent_id] += 1
+        
+        # Rolling completion time window for the system average
+        if len(self._recent_proc_times) == self._recent_proc_times.maxlen:
+            evicted = self._recent_proc_times[0]
+            if evicted > 0:
+                self._proc_time_sum -= evicted
+                self._proc_time_count -= 1
+        self._recent_proc_times.append(completion_time)
+        if completion_time > 0:
+            self._proc_time_sum += completion_time
+            self._proc_time_count += 1
         
         # Add to task history for learning
-        self.task_history.append({
-            'task_id': task_id,
-            'agent_id': agent_id,
-            'success': result['success'],
-            'processing_time': completion_time,
-            'timestamp': datetime.now()
-        })
+        self._history[self._history_pos] = (
+            task_id, self._agent_serials[agent_id], result['success'], completion_time, _wall_now()
+        )
+        self._history_pos = (self._history_pos + 1) % self._HISTORY_SIZE
+        self._history_count = min(self._history_count + 1, self._HISTORY_SIZE)
         
         # Update system performance metrics
         self._update_system_metrics()
@@ -635,76 +1064,82 @@ class MultiAgentOrchestrator:
             return
             
         agent_state = self.agents[agent_id]
-        metrics = agent_state.performance_metrics
+        i = self._agent_idx[agent_id]
         
-        # Adaptive learning rate based on recent performance
-        recent_tasks = [t for t in list(self.task_history)[-20:] if t['agent_id'] == agent_id]
-        learning_rate = 0.1 if len(recent_tasks) < 10 else 0.05
+        # Adaptive learning rate based on the agent's share of the last 20 completed tasks
+        learning_rate = 0.1 if self._recent_task_counts[agent_id] < 10 else 0.05
+        retention = 1 - learning_rate
         
         # Update success rate (exponential moving average)
         current_success = 1.0 if success else 0.0
-        metrics['success_rate'] = (learning_rate * current_success + 
-                                 (1 - learning_rate) * metrics['success_rate'])
+        self._succ[i] = learning_rate * current_success + retention * self._succ[i]
         
         # Update processing time (handle division by zero)
         if processing_time > 0:
-            metrics['avg_processing_time'] = (learning_rate * processing_time + 
-                                            (1 - learning_rate) * metrics['avg_processing_time'])
+            self._avg_time[i] = learning_rate * processing_time + retention * self._avg_time[i]
         
         # Update reliability score with non-linear adjustments
+        reliability = self._rel[i]
         if success:
-            reliability_boost = 0.02 * (1 - metrics['reliability_score'])  # Larger boost when reliability is low
-            metrics['reliability_score'] = min(1.0, metrics['reliability_score'] + reliability_boost)
+            reliability_boost = 0.02 * (1 - reliability)  # Larger boost when reliability is low
+            self._rel[i] = min(1.0, reliability + reliability_boost)
         else:
-            reliability_penalty = 0.05 * metrics['reliability_score']  # Larger penalty when reliability is high
-            metrics['reliability_score'] = max(0.1, metrics['reliability_score'] - reliability_penalty)
+            reliability_penalty = 0.05 * reliability  # Larger penalty when reliability is high
+            self._rel[i] = max(0.1, reliability - reliability_penalty)
         
         # Update efficiency score (inverse of processing time normalized)
         max_expected_time = 10.0  # Maximum expected processing time in seconds
         efficiency = 1.0 - (min(processing_time, max_expected_time) / max_expected_time)
-        metrics['efficiency_score'] = (learning_rate * efficiency + 
-                                     (1 - learning_rate) * metrics['efficiency_score'])
+        self._eff[i] = learning_rate * efficiency + retention * self._eff[i]
         
         # Update throughput (tasks per minute)
         total_tasks = agent_state.completed_tasks + agent_state.failed_tasks
         if total_tasks > 0:
-            metrics['throughput'] = agent_state.completed_tasks / total_tasks * 60  # Normalized to per minute
+            self._throughput[i] = agent_state.completed_tasks / total_tasks * 60  # Normalized to per minute
+        
+        # Mirror the slot values into the metrics dict read by reports and coordination
+        agent_state.performance_metrics.update(
+            success_rate=float(self._succ[i]),
+            avg_processing_time=float(self._avg_time[i]),
+            reliability_score=float(self._rel[i]),
+            efficiency_score=float(self._eff[i]),
+            throughput=float(self._throughput[i])
+        )
 
     def _update_trust_scores(self, agent_id: str, success: bool):
         """Update trust scores between agents based on performance"""
-        trust_change = 0.05 if success else -0.1
+        i = self._agent_idx.get(agent_id)
+        if i is None:
+            return
         
-        for other_agent_id in self.agents:
-            if other_agent_id != agent_id:
-                # Update trust in both directions
-                trust_key_forward = (agent_id, other_agent_id)
-                trust_key_backward = (other_agent_id, agent_id)
-                
-                if trust_key_forward in self.trust_scores:
-                    self.trust_scores[trust_key_forward] = max(0.1, min(1.0,
-                        self.trust_scores[trust_key_forward] + trust_change))
-                
-                if trust_key_backward in self.trust_scores:
-                    self.trust_scores[trust_key_backward] = max(0.1, min(1.0,
-                        self.trust_scores[trust_key_backward] + trust_change))
+        trust_change = 0.05 if success else -0.1
+        n = len(self._agent_ids)
+        
+        # Update trust in both directions as single row/column operations
+        row = self.trust_matrix[i, :n]
+        col = self.trust_matrix[:n, i]
+        previous_col = col.copy()
+        np.clip(row + trust_change, 0.1, 1.0, out=row)
+        np.clip(col + trust_change, 0.1, 1.0, out=col)
+        self.trust_matrix[i, i] = 0.0
+        
+        # Keep the running row sums current: each other agent's row changed in column i only
+        self._trust_row_sum[:n] += col - previous_col
+        self._trust_row_sum[i] = row.sum(dtype=np.float64)
 
     def _update_system_metrics(self):
         """Update overall system performance metrics comprehensively"""
         total_tasks = self.performance_metrics['tasks_completed'] + self.performance_metrics['tasks_failed']
         
-        # Update average task completion time
-        if total_tasks > 0:
-            recent_tasks = list(self.task_history)[-100:]  # Last 100 tasks
-            if recent_tasks:
-                avg_time = np.mean([t['processing_time'] for t in recent_tasks if t['processing_time'] > 0])
-                self.performance_metrics['avg_task_completion_time'] = avg_time
-        
-        # Update agent utilization
-        for agent_id, agent_state in self.agents.items():
-            max_tasks = self.agent_configs[agent_id].resource_limits['max_concurrent_tasks']
-            current_tasks = len(agent_state.task_queue)
-            utilization = current_tasks / max_tasks if max_tasks > 0 else 0.0
-            self.performance_metrics['agent_utilization'][agent_id] = utilization
+        # Update average task completion time (last 100 tasks, maintained incrementally on completion)
+        if total_tasks > 0 and self._proc_time_count:
+            self.performance_metrics['avg_task_completion_time'] = self._proc_time_sum / self._proc_time_count
+        
+        # Update agent utilization from the queue length and max load slot arrays
+        n = len(self._agent_ids)
+        max_tasks = self._maxload[:n]
+        utilization = np.divide(self._qlen[:n], max_tasks, out=np.zeros(n), where=max_tasks > 0)
+        self.performance_metrics['agent_utilization'] = dict(zip(self._agent_ids, utilization.tolist()))
         
         # Update system throughput and error rate
         if total_tasks > 0:
@@ -715,16 +1150,18 @@ class MultiAgentOrchestrator:
                                coordination_mode: CoordinationMode) -> CoordinationResult:
         """Coordinate multiple agents for complex task execution"""
         self.performance_metrics['coordination_events'] += 1
+        coord_id = f"COORD_{secrets.token_hex(4)}"
         
-        print(f"🤝 Coordinating agents {agent_ids} for task {task_id} using {coordination_mode.value} mode")
+        logger.info("🤝 Coordinating agents %s for task %s using %s mode",
+                    agent_ids, task_id, _MODE_VALUE[coordination_mode])
         
         # Validate agent availability
-        available_agents = [aid for aid in agent_ids if aid in self.agents and 
-                          self.agents[aid].status == AgentStatus.ACTIVE]
+        active_agents = self._active_agents
+        available_agents = [aid for aid in agent_ids if aid in active_agents]
         
         if not available_agents:
             return CoordinationResult(
-                coordination_id=f"COORD_{uuid.uuid4().hex[:8]}",
+                coordination_id=coord_id,
                 task_id=task_id,
                 participating_agents=[],
                 result={'error': 'No available agents for coordination'},
@@ -736,17 +1173,22 @@ class MultiAgentOrchestrator:
         try:
             # Simulate coordination process with timeout
             coordination_results = {}
-            coordination_tasks = []
             
-            for agent_id in available_agents:
-                task = self._get_agent_contribution(agent_id, task_id)
-                coordination_tasks.append(task)
-            
-            # Wait for all contributions with timeout
-            results = await asyncio.wait_for(
-                asyncio.gather(*coordination_tasks, return_exceptions=True),
-                timeout=10.0
-            )
+            if len(available_agents) == 1:
+                # Single contributor: await it directly instead of through gather
+                async with async_timeout(10.0):
+                    try:
+                        results = [await self._get_agent_contribution(available_agents[0], task_id)]
+                    except Exception as e:
+                        results = [e]
+            else:
+                coordination_tasks = [
+                    self._get_agent_contribution(agent_id, task_id) for agent_id in available_agents
+                ]
+                
+                # Wait for all contributions with timeout (no extra wrapper task, unlike wait_for)
+                async with async_timeout(10.0):
+                    results = await asyncio.gather(*coordination_tasks, return_exceptions=True)
             
             # Process results
             for i, agent_id in enumerate(available_agents):
@@ -764,7 +1206,7 @@ class MultiAgentOrchestrator:
             combined_result = self._combine_coordination_results(coordination_results, coordination_mode)
             
             coordination_result = CoordinationResult(
-                coordination_id=f"COORD_{uuid.uuid4().hex[:8]}",
+                coordination_id=coord_id,
                 task_id=task_id,
                 participating_agents=available_agents,
                 result=combined_result,
@@ -773,13 +1215,17 @@ class MultiAgentOrchestrator:
                 success=True
             )
             
-            self.coordination_history.append(coordination_result)
+            # History keeps only the combined outcome, not every agent's contribution dict
+            self._record_coordination(replace(coordination_result, result={
+                'combined_value': combined_result['combined_value'],
+                'combined_mode': combined_result['combined_mode']
+            }))
             
             return coordination_result
             
         except asyncio.TimeoutError:
             error_result = CoordinationResult(
-                coordination_id=f"COORD_{uuid.uuid4().hex[:8]}",
+                coordination_id=coord_id,
                 task_id=task_id,
                 participating_agents=available_agents,
                 result={'error': 'Coordination timeout'},
@@ -787,19 +1233,24 @@ class MultiAgentOrchestrator:
                 timestamp=datetime.now(),
                 success=False
             )
-            self.coordination_history.append(error_result)
+            self._record_coordination(error_result)
             return error_result
 
+    def _record_coordination(self, coordination_result: CoordinationResult):
+        """Append a coordination to the history and the recent success window"""
+        self.coordination_history.append(coordination_result)
+        self._recent_successes.append(1 if coordination_result.success else 0)
+
     async def _get_agent_contribution(self, agent_id: str, task_id: str) -> Dict:
         """Get contribution from an agent for coordination with realistic simulation"""
         # Simulate agent processing time based on agent type
-        processing_time = np.random.uniform(0.1, 1.0)
+        processing_time = self._uniform(0.1, 1.0)
         await asyncio.sleep(processing_time)
         
         # Generate realistic contribution based on agent type
         agent_type = self.agents[agent_id].agent_type
-        contribution_base = np.random.uniform(0.3, 0.9)
-        confidence_base = np.random.uniform(0.5, 0.95)
+        contribution_base = self._uniform(0.3, 0.9)
+        confidence_base = self._uniform(0.5, 0.95)
         
         # Adjust based on agent performance
         performance_boost = self.agents[agent_id].performance_metrics['success_rate'] * 0.2
@@ -808,7 +1259,7 @@ class MultiAgentOrchestrator:
         
         return {
             'agent_id': agent_id,
-            'agent_type': agent_type.value,
+            'agent_type': _AGENT_TYPE_VALUE[agent_type],
             'contribution': contribution,
             'confidence': confidence,
             'processing_time': processing_time,
@@ -823,21 +1274,11 @@ class MultiAgentOrchestrator:
         
         if mode == CoordinationMode.COLLABORATIVE:
             # Weighted average based on confidence and performance
-            weighted_contributions = []
-            total_weight = 0
-            
-            for agent_id, result in results.items():
-                if 'error' not in result:
-                    # Weight by confidence and agent reliability
-                    agent_weight = (result['confidence'] * 
-                                  self.agents[agent_id].performance_metrics['reliability_score'])
-                    weighted_contributions.append(result['contribution'] * agent_weight)
-                    total_weight += agent_weight
+            valid_results = [(agent_id, result) for agent_id, result in results.items() if 'error' not in result]
+            combined_value = self._weighted_contribution(valid_results)
             
-            if total_weight > 0:
-                combined_value = sum(weighted_contributions) / total_weight
-            else:
-                combined_value = np.mean([r['contribution'] for r in results.values()])
+            if combined_value is None:
+                combined_value = math.fsum(r['contribution'] for r in results.values()) / len(results)
                 
         elif mode == CoordinationMode.COMPETITIVE:
             # Select the best contribution (highest confidence * contribution)
@@ -854,46 +1295,113 @@ class MultiAgentOrchestrator:
             combined_value = best_contribution if best_score >= 0 else 0.0
             
         else:  # HYBRID
-            # Blend collaborative and competitive approaches
-            collaborative_result = self._combine_coordination_results(results, CoordinationMode.COLLABORATIVE)
-            competitive_result = self._combine_coordination_results(results, CoordinationMode.COMPETITIVE)
-            
-            # Weight based on result quality
-            collaborative_quality = np.mean([r['confidence'] for r in results.values()])
-            combined_value = (collaborative_result.get('combined_value', 0) * collaborative_quality +
-                            competitive_result.get('combined_value', 0) * (1 - collaborative_quality))
+            combined_value = self._hybrid_combined_value(results)
         
         return {
             'combined_value': combined_value,
             'participating_agents': list(results.keys()),
             'individual_contributions': results,
-            'combined_mode': mode.value,
+            'combined_mode': _MODE_VALUE[mode],
             'combined_at': datetime.now()
         }
 
+    def _hybrid_combined_value(self, results: Dict[str, Dict]) -> float:
+        """Blend the collaborative and competitive combinations in a single pass over the results"""
+        total_weight = 0.0
+        weighted_sum = 0.0
+        confidence_sum = 0.0
+        contribution_sum = 0.0
+        best_score = -1
+        best_contribution = 0
+        
+        for agent_id, result in results.items():
+            contribution = result['contribution']
+            confidence = result['confidence']
+            confidence_sum += confidence
+            contribution_sum += contribution
+            
+            if 'error' not in result:
+                # Collaborative: weight by confidence and agent reliability
+                weight = confidence * self.agents[agent_id].performance_metrics['reliability_score']
+                total_weight += weight
+                weighted_sum += contribution * weight
+                
+                # Competitive: best confidence * contribution
+                score = contribution * confidence
+                if score > best_score:
+                    best_score = score
+                    best_contribution = contribution
+        
+        n = len(results)
+        collaborative_value = weighted_sum / total_weight if total_weight > 0 else contribution_sum / n
+        competitive_value = best_contribution if best_score >= 0 else 0.0
+        
+        # Weight based on result quality
+        collaborative_quality = confidence_sum / n
+        return collaborative_value * collaborative_quality + competitive_value * (1 - collaborative_quality)
+
+    def _weighted_contribution(self, valid_results: List[Tuple[str, Dict]]) -> Optional[float]:
+        """Contribution averaged with confidence x reliability weights, or None if the weights sum to zero"""
+        n = len(valid_results)
+        
+        if n < 8:
+            # Small groups: plain float arithmetic beats building arrays
+            contributions = [result['contribution'] for _, result in valid_results]
+            weights = [result['confidence'] * self.agents[agent_id].performance_metrics['reliability_score']
+                       for agent_id, result in valid_results]
+            total_weight = math.fsum(weights)
+            if total_weight > 0:
+                return math.fsum(map(operator.mul, contributions, weights)) / total_weight
+            return None
+        
+        contributions = np.fromiter((result['contribution'] for _, result in valid_results),
+                                    dtype=np.float64, count=n)
+        confidences = np.fromiter((result['confidence'] for _, result in valid_results), dtype=np.float64, count=n)
+        reliabilities = np.fromiter((self.agents[agent_id].performance_metrics['reliability_score']
+                                     for agent_id, _ in valid_results), dtype=np.float64, count=n)
+        
+        if NUMBA_AVAILABLE and n >= 32:
+            # Large groups: one compiled pass instead of temporaries for the weights
+            weighted_sum, total_weight = _weighted_combine_kernel(contributions, confidences, reliabilities)
+        else:
+            weights = confidences * reliabilities
+            total_weight = weights.sum()
+            weighted_sum = contributions @ weights
+        if total_weight > 0:
+            return float(weighted_sum / total_weight)
+        return None
+
     async def _monitor_agents(self):
         """Continuous monitoring of agent health and performance"""
+        next_status_log = _now() + 60
         while self.is_running:
             try:
-                current_time = datetime.now()
+                now = _now()
                 agents_to_remove = []
                 
-                for agent_id, agent_state in self.agents.items():
+                # Draw this tick's simulated resource usage for every agent at once
+                n = len(self.agents)
+                memory_usage = self._rng.uniform(10, 200, n).tolist()
+                cpu_usage = self._rng.uniform(0.1, 0.8, n).tolist()
+                network_usage = self._rng.uniform(1, 50, n).tolist()
+                
+                for k, (agent_id, agent_state) in enumerate(self.agents.items()):
                     # Check agent heartbeat
-                    time_since_heartbeat = (current_time - agent_state.last_heartbeat).total_seconds()
+                    time_since_heartbeat = now - agent_state.last_heartbeat
                     
                     if time_since_heartbeat > 300:  # 5 minutes without heartbeat
-                        print(f"⚠️ Agent {agent_id} appears unresponsive. Time since heartbeat: {time_since_heartbeat:.1f}s")
-                        agent_state.status = AgentStatus.ERROR
+                        logger.warning("⚠️ Agent %s appears unresponsive. Time since heartbeat: %.1fs",
+                                       agent_id, time_since_heartbeat)
+                        self._set_agent_status(agent_id, AgentStatus.ERROR)
                     
                     # Update resource usage simulation
-                    agent_state.resource_usage['memory_usage'] = np.random.uniform(10, 200)
-                    agent_state.resource_usage['cpu_usage'] = np.random.uniform(0.1, 0.8)
-                    agent_state.resource_usage['network_usage'] = np.random.uniform(1, 50)
+                    agent_state.resource_usage['memory_usage'] = memory_usage[k]
+                    agent_state.resource_usage['cpu_usage'] = cpu_usage[k]
+                    agent_state.resource_usage['network_usage'] = network_usage[k]
                     
                     # Simulate heartbeat for active agents
                     if agent_state.status == AgentStatus.ACTIVE:
-                        agent_state.last_heartbeat = current_time
+                        agent_state.last_heartbeat = now
                     
                     # Remove terminated agents
                     if agent_state.status == AgentStatus.TERMINATED:
@@ -904,16 +1412,16 @@ class MultiAgentOrchestrator:
                     await self._remove_agent(agent_id)
                 
                 # Log system status periodically
-                if int(current_time.timestamp()) % 60 == 0:  # Every minute
-                    active_agents = sum(1 for a in self.agents.values() if a.status == AgentStatus.ACTIVE)
-                    print(f"📊 System Status: {active_agents}/{len(self.agents)} agents active, "
-                          f"{len(self.task_queue)} tasks queued, "
-                          f"{self.performance_metrics['tasks_completed']} tasks completed")
+                if now >= next_status_log:  # Every minute
+                    next_status_log = now + 60
+                    logger.info("📊 System Status: %d/%d agents active, %d tasks queued, %d tasks completed",
+                                len(self._active_agents), len(self.agents), len(self._task_heap),
+                                self.performance_metrics['tasks_completed'])
                 
                 await asyncio.sleep(10)  # Check every 10 seconds
                 
             except Exception as e:
-                print(f"❌ Error in agent monitoring: {e}")
+                logger.error("❌ Error in agent monitoring: %s", e)
                 await asyncio.sleep(30)  # Longer delay on error
 
     async def _optimize_system_performance(self):
@@ -933,21 +1441,15 @@ class MultiAgentOrchestrator:
                         self.learning_parameters['collaboration_threshold'] = max(0.5,
                             self.learning_parameters['collaboration_threshold'] - 0.02)
                 
-                # Clean up old coordination history
+                # Clean up old coordination history (appended in time order, so expired entries lead)
                 cutoff_time = datetime.now() - timedelta(hours=24)
-                self.coordination_history = [
-                    coord for coord in self.coordination_history 
-                    if coord.timestamp > cutoff_time
-                ]
-                
-                # Trim task history if too large
-                if len(self.task_history) > self.task_history.maxlen:
-                    self.task_history = deque(list(self.task_history)[-self.task_history.maxlen:])
+                while self.coordination_history and self.coordination_history[0].timestamp <= cutoff_time:
+                    self.coordination_history.popleft()
                 
                 await asyncio.sleep(60)  # Optimize every minute
                 
             except Exception as e:
-                print(f"❌ Error in performance optimization: {e}")
+                logger.error("❌ Error in performance optimization: %s", e)
                 await asyncio.sleep(120)  # Longer delay on error
 
     async def _remove_agent(self, agent_id: str):
@@ -957,62 +1459,72 @@ class MultiAgentOrchestrator:
             
             # Reassign any pending tasks
             if agent_state.task_queue:
-                print(f"🔄 Reassigning {len(agent_state.task_queue)} tasks from agent {agent_id}")
-                for task_item in agent_state.task_queue:
+                logger.info("🔄 Reassigning %d tasks from agent %s", len(agent_state.task_queue), agent_id)
+                for task_item in list(agent_state.task_queue.values()):
                     # Resubmit tasks to the system
                     await self.submit_task(
-                        task_type=task_item['task_type'],
+                        task_type=task_item.task_type,
                         requirements=[],  # Will be determined by original task
-                        input_data=task_item['input_data'],
-                        priority=task_item.get('priority', 1)
+                        input_data=task_item.input_data,
+                        priority=task_item.priority
                     )
             
             # Remove from capability registry
-            for capability in agent_state.capabilities:
-                if agent_id in self.capability_registry[capability]:
-                    self.capability_registry[capability].remove(agent_id)
+            self._deregister_agent(agent_id)
             
-            # Remove trust scores
-            trust_keys_to_remove = [k for k in self.trust_scores.keys() if agent_id in k]
-            for key in trust_keys_to_remove:
-                del self.trust_scores[key]
+            # Release the agent's trust row/column
+            self._release_agent_slot(agent_id)
             
             # Remove agent
+            self._status_counts[agent_state.status] -= 1
+            self._active_agents.discard(agent_id)
+            del self._agent_summary[agent_id]
             del self.agents[agent_id]
             del self.agent_configs[agent_id]
             
-            print(f"🗑️ Removed agent: {agent_id}")
+            logger.info("🗑️ Removed agent: %s", agent_id)
+
+    def _deregister_agent(self, agent_id: str):
+        """Remove an agent from the capability registry, dropping capabilities left empty"""
+        for capability in self.agents[agent_id].capabilities:
+            registered = self.capability_registry.get(capability)
+            if registered is not None:
+                registered.discard(agent_id)
+                if not registered:
+                    del self.capability_registry[capability]
 
     async def get_system_status(self) -> Dict[str, Any]:
-        """Get comprehensive system status report"""
-        active_agents = sum(1 for a in self.agents.values() if a.status == AgentStatus.ACTIVE)
-        total_tasks = self.performance_metrics['tasks_completed'] + self.performance_metrics['tasks_failed']
+        """Get comprehensive system status report (a snapshot, safe to keep or serialize)"""
+        active_agents = self._status_counts[AgentStatus.ACTIVE]
+        
+        # Only the load changes between polls; refresh it from the queue length slots
+        n = len(self._agent_ids)
+        for agent_id, load in zip(self._agent_ids, self._qlen[:n].astype(np.int64).tolist()):
+            self._agent_summary[agent_id]['current_load'] = load
         
         return {
             'system_health': {
                 'total_agents': len(self.agents),
                 'active_agents': active_agents,
-                'queued_tasks': len(self.task_queue),
+                'queued_tasks': len(self._task_heap),
                 'system_uptime': 'N/A',  # Would be calculated from start time
                 'is_running': self.is_running
             },
-            'performance_metrics': self.performance_metrics.copy(),
+            'performance_metrics': dict(self.performance_metrics),
             'agent_summary': {
                 agent_id: {
-                    'type': state.agent_type.value,
-                    'status': state.status.value,
-                    'capabilities': state.capabilities,
-                    'performance': state.performance_metrics,
-                    'current_load': len(state.task_queue)
+                    **summary,
+                    'capabilities': list(summary['capabilities']),
+                    'performance': dict(summary['performance'])
                 }
-                for agent_id, state in self.agents.items()
+                for agent_id, summary in self._agent_summary.items()
             },
             'coordination_stats': {
                 'total_coordination_events': len(self.coordination_history),
-                'recent_coordination_success_rate': np.mean([
-                    1 if coord.success else 0 
-                    for coord in list(self.coordination_history)[-10:]
-                ]) if self.coordination_history else 0.0
+                'recent_coordination_success_rate': (
+                    sum(self._recent_successes) / len(self._recent_successes)
+                    if self._recent_successes else 0.0
+                )
             }
         }
 
@@ -1022,17 +1534,15 @@ class MultiAgentOrchestrator:
         
         self.is_running = False
         
-        # Cancel monitoring task
-        if self._monitor_task:
-            self._monitor_task.cancel()
-            try:
-                await self._monitor_task
-            except asyncio.CancelledError:
-                pass
+        # Cancel monitoring, assignment, optimization and in-flight task processing
+        background_tasks = list(self._background)
+        for background_task in background_tasks:
+            background_task.cancel()
+        await asyncio.gather(*background_tasks, return_exceptions=True)
         
         # Set all agents to terminated status
         for agent_id in list(self.agents.keys()):
-            self.agents[agent_id].status = AgentStatus.TERMINATED
+            self._set_agent_status(agent_id, AgentStatus.TERMINATED)
         
         print("✅ Multi-Agent Orchestrator shutdown complete")
 
@@ -5,15 +5,54 @@ Institutional-grade market participant behavior modeling
 """
 
 import asyncio
+import os
+import time
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+from collections import defaultdict
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from sklearn.ensemble import IsolationForest
-from sklearn.cluster import DBSCAN
-import tensorflow as tf
+
+def _as_frame(transaction_history) -> 'TransactionFrame':
+    """Columnar view of a transaction history given as a TransactionFrame or a list of dicts"""
+    if isinstance(transaction_history, TransactionFrame):
+        return transaction_history
+    return TransactionFrame.from_records(transaction_history)
+
+def _columnar_features(transactions: 'TransactionFrame') -> Dict[str, float]:
+    """Behavioral features computed purely from the transaction columns"""
+    features = {}
+    ts, volume = transactions.ts, transactions.volume
+    n = len(ts)
+    
+    # Trading frequency features (trades per day, over at least one day)
+    span_days = (ts[-1] - ts[0]) / 86400 if n else 0.0
+    features['trading_frequency'] = n / max(span_days, 1.0)
+    
+    # Position sizing features
+    avg_size = float(volume.mean()) if n else 0.0
+    features['avg_position_size'] = avg_size
+    features['position_size_volatility'] = float(volume.std()) / avg_size if avg_size > 0 else 0.0
+    
+    # Holding period features (seconds between consecutive transactions)
+    if n > 1:
+        intervals = np.diff(ts)
+        avg_interval = float(intervals.mean())
+        features['avg_holding_period'] = avg_interval
+        features['holding_period_consistency'] = (
+            1.0 / (1.0 + float(intervals.std()) / avg_interval) if avg_interval > 0 else 0.0
+        )
+    else:
+        features['avg_holding_period'] = 0.0
+        features['holding_period_consistency'] = 0.0
+    
+    return features
+
+def _epoch_seconds(timestamp) -> float:
+    """Transaction timestamp (datetime or epoch seconds) as float epoch seconds"""
+    return timestamp.timestamp() if isinstance(timestamp, datetime) else float(timestamp)
 
 class ParticipantType(Enum):
     RETAIL = "retail"
@@ -23,6 +62,23 @@ class ParticipantType(Enum):
     HFT = "high_frequency_trader"
     WHALE = "whale"
 
+# Enum <-> value lookups; string keys hash in C, enum members hash through Enum.__hash__
+_PTYPE_VALUES = {participant_type: participant_type.value for participant_type in ParticipantType}
+_PTYPE_BY_VALUE = {value: participant_type for participant_type, value in _PTYPE_VALUES.items()}
+
+# Behavioral feature columns, in feature-matrix order for the anomaly detector
+_BEHAVIORAL_FEATURES = (
+    'trading_frequency', 'session_activity', 'avg_position_size', 'position_size_volatility',
+    'avg_holding_period', 'holding_period_consistency', 'profit_taking_aggressiveness',
+    'loss_cutting_behavior', 'risk_management_consistency', 'drawdown_tolerance'
+)
+
+# Feature columns fed to participant type classification, in feature-matrix order
+_CLASSIFIER_FEATURES = ('trading_frequency', 'avg_position_size', 'avg_holding_period', 'profit_taking_aggressiveness')
+
+# Fear & Greed Index component weights, in _calculate_fear_greed_index component order
+_FG_WEIGHTS = np.array([25.0, 25.0, 15.0, 15.0, 20.0])
+
 class BehavioralPattern(Enum):
     MOMENTUM_CHASING = "momentum_chasing"
     FEAR_OF_MISSING_OUT = "fomo"
@@ -32,19 +88,96 @@ class BehavioralPattern(Enum):
     ARBITRAGE_EXECUTION = "arbitrage_execution"
     MARKET_MAKING = "market_making"
 
+_PATTERN_VALUES = {pattern: pattern.value for pattern in BehavioralPattern}
+
 @dataclass
+class TransactionFrame:
+    """Column-oriented transaction history, ordered by timestamp"""
+    ts: np.ndarray  # float64 epoch seconds
+    volume: np.ndarray  # float64
+    price: np.ndarray  # float64
+    fomo: np.ndarray  # bool, per-transaction fomo_indicator
+    
+    def __len__(self) -> int:
+        return len(self.ts)
+    
+    @classmethod
+    def from_records(cls, transaction_history: List[Dict]) -> 'TransactionFrame':
+        """Build the columns from a list of transaction dicts in a single conversion"""
+        n = len(transaction_history)
+        frame = cls(
+            ts=np.fromiter((_epoch_seconds(t['timestamp']) for t in transaction_history),
+                           dtype=np.float64, count=n),
+            volume=np.fromiter((t.get('volume', 0) for t in transaction_history), dtype=np.float64, count=n),
+            price=np.fromiter((t.get('price', 0) for t in transaction_history), dtype=np.float64, count=n),
+            fomo=np.fromiter((bool(t.get('fomo_indicator', False)) for t in transaction_history),
+                             dtype=np.bool_, count=n)
+        )
+        
+        ts = frame.ts
+        if n > 1 and np.any(ts[1:] < ts[:-1]):
+            order = np.argsort(ts, kind='stable')
+            frame = cls(ts=ts[order], volume=frame.volume[order], price=frame.price[order], fomo=frame.fomo[order])
+        
+        return frame
+    
+    @classmethod
+    def from_pandas(cls, df: pd.DataFrame) -> 'TransactionFrame':
+        """Wrap the columns of a time-ordered DataFrame (as written by to_pandas); missing columns are zero-filled"""
+        n = len(df)
+        
+        def column(name, dtype):
+            return df[name].to_numpy(dtype=dtype) if name in df.columns else np.zeros(n, dtype=dtype)
+        
+        return cls(ts=column('ts', np.float64), volume=column('volume', np.float64),
+                   price=column('price', np.float64), fomo=column('fomo', np.bool_))
+    
+    def to_pandas(self) -> pd.DataFrame:
+        """Columns as a DataFrame, the layout TransactionStore persists"""
+        return pd.DataFrame({'ts': self.ts, 'volume': self.volume, 'price': self.price, 'fomo': self.fomo})
+    
+    def recent_records(self, count: int) -> List[Dict]:
+        """The last count transactions as dicts, in the shape from_records accepts"""
+        return [
+            {'timestamp': ts, 'volume': volume, 'price': price, 'fomo_indicator': fomo}
+            for ts, volume, price, fomo in zip(self.ts[-count:].tolist(), self.volume[-count:].tolist(),
+                                               self.price[-count:].tolist(), self.fomo[-count:].tolist())
+        ]
+
+class TransactionStore:
+    """
+    On-disk columnar cache of participant transaction histories, one zstd Parquet file per address (needs pyarrow)
+    """
+    
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+    
+    def _path(self, address: str) -> str:
+        return os.path.join(self.directory, f"{address}.parquet")
+    
+    def save(self, address: str, transactions: TransactionFrame):
+        transactions.to_pandas().to_parquet(self._path(address), compression='zstd', engine='pyarrow', index=False)
+    
+    def load(self, address: str, columns: Optional[Sequence[str]] = None) -> TransactionFrame:
+        """Read a participant's history, optionally only the named columns"""
+        df = pd.read_parquet(self._path(address), columns=list(columns) if columns else None, engine='pyarrow')
+        return TransactionFrame.from_pandas(df)
+
+@dataclass(slots=True, frozen=True)
 class ParticipantBehavior:
     """Morgan Stanley-inspired participant behavior analysis"""
     address: str
     participant_type: ParticipantType
-    behavioral_patterns: List[BehavioralPattern]
+    behavioral_patterns: Tuple[BehavioralPattern, ...]
     confidence: float
-    recent_activities: List[Dict]
+    recent_activities: Tuple[Dict, ...]
     risk_profile: str
     influence_score: float
-    timestamp: datetime
+    timestamp: float  # epoch seconds
+    features: Dict[str, float] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MarketSentiment:
     """Behavioral finance-inspired market sentiment analysis"""
     overall_sentiment: str
@@ -53,7 +186,7 @@ class MarketSentiment:
     participant_sentiments: Dict[ParticipantType, float]
     dominant_behavior: BehavioralPattern
     sentiment_momentum: float
-    timestamp: datetime
+    timestamp: float  # epoch seconds
 
 class BehavioralModelsAI:
     """
@@ -71,7 +204,6 @@ class BehavioralModelsAI:
         self.config = {
             'clustering': {
                 'min_cluster_size': 5,
-                'eps': 0.5,
                 'features': ['trade_size', 'frequency', 'holding_period', 'profit_taking']
             },
             'sentiment': {
@@ -80,8 +212,12 @@ class BehavioralModelsAI:
                 'confidence_threshold': 0.7
             },
             'anomaly_detection': {
+                'n_estimators': 64,
                 'contamination': 0.1,
                 'random_state': 42
+            },
+            'profiles': {
+                'max_cached': 100000  # participant analyses kept for reuse
             }
         }
         
@@ -90,38 +226,130 @@ class BehavioralModelsAI:
 
     async def analyze_participant_behavior(self, 
                                          address: str,
-                                         transaction_history: List[Dict]) -> ParticipantBehavior:
+                                         transaction_history: Union[List[Dict], TransactionFrame]) -> ParticipantBehavior:
         """
         Morgan Stanley-inspired participant behavior analysis
+        
+        transaction_history is a list of transaction dicts or an already columnar TransactionFrame
+        (e.g. from TransactionStore.load).
         """
+        # Reuse the previous analysis while the participant's history is unchanged
+        history_key = self._history_key(transaction_history)
+        cached = self._cached_behavior(address, history_key)
+        if cached is not None:
+            return cached
+        
+        # Columnar view of the history, built once and shared by every analysis step
+        transactions = _as_frame(transaction_history)
+        
         # Feature extraction
-        features = await self._extract_behavioral_features(address, transaction_history)
+        features = self._extract_behavioral_features(address, transactions)
         
         # Participant type classification
-        participant_type = await self._classify_participant_type(features)
+        participant_type = self._classify_participant_type(features)
         
+        return self._complete_behavior(address, transaction_history, history_key,
+                                       transactions, features, participant_type)
+
+    async def analyze_participants_batch(self,
+                                         addresses: List[str],
+                                         transaction_histories: List[Union[List[Dict], TransactionFrame]]) -> List[ParticipantBehavior]:
+        """
+        Analyze many participants at once, classifying the whole batch in one vectorized step
+        """
+        behaviors: List[Optional[ParticipantBehavior]] = [None] * len(addresses)
+        pending = []
+        
+        for position, (address, transaction_history) in enumerate(zip(addresses, transaction_histories)):
+            history_key = self._history_key(transaction_history)
+            cached = self._cached_behavior(address, history_key)
+            if cached is not None:
+                behaviors[position] = cached
+                continue
+            
+            transactions = _as_frame(transaction_history)
+            features = self._extract_behavioral_features(address, transactions)
+            pending.append((position, history_key, transactions, features))
+        
+        if pending:
+            feature_matrix = np.array([[features[name] for name in _CLASSIFIER_FEATURES]
+                                       for *_, features in pending])
+            participant_types = self._classify_participant_types(feature_matrix)
+            
+            for (position, history_key, transactions, features), participant_type in zip(pending, participant_types):
+                behaviors[position] = self._complete_behavior(
+                    addresses[position], transaction_histories[position], history_key,
+                    transactions, features, participant_type
+                )
+        
+        return behaviors
+
+    @staticmethod
+    def _history_key(transaction_history: Union[List[Dict], TransactionFrame]) -> Tuple:
+        """Cheap signature of a transaction history: its length and last timestamp"""
+        if isinstance(transaction_history, TransactionFrame):
+            n = len(transaction_history)
+            return (n, float(transaction_history.ts[-1]) if n else None)
+        return (len(transaction_history),
+                transaction_history[-1].get('timestamp') if transaction_history else None)
+
+    def _cached_behavior(self, address: str, history_key: Tuple) -> Optional[ParticipantBehavior]:
+        """Previous analysis of this participant, restamped, if its history is unchanged"""
+        profile = self.participant_profiles.get(address)
+        if profile is not None and profile['history_key'] == history_key:
+            return replace(profile['behavior'], timestamp=time.time())
+        return None
+
+    def _complete_behavior(self,
+                           address: str,
+                           transaction_history: Union[List[Dict], TransactionFrame],
+                           history_key: Tuple,
+                           transactions: TransactionFrame,
+                           features: Dict,
+                           participant_type: ParticipantType) -> ParticipantBehavior:
+        """
+        Finish a participant analysis from its features and type, and record it in the profile cache
+        """
         # Behavioral pattern recognition
-        behavioral_patterns = await self._identify_behavioral_patterns(features, transaction_history)
+        behavioral_patterns = self._identify_behavioral_patterns(features, transactions)
         
         # Risk profile assessment
-        risk_profile = await self._assess_risk_profile(features, behavioral_patterns)
+        risk_profile = self._assess_risk_profile(features, behavioral_patterns)
         
         # Influence scoring
-        influence_score = await self._calculate_influence_score(features, transaction_history)
+        influence_score = self._calculate_influence_score(features, transactions)
         
         # Confidence calculation
-        confidence = await self._calculate_behavior_confidence(features, behavioral_patterns)
+        confidence = self._calculate_behavior_confidence(features, behavioral_patterns)
         
-        return ParticipantBehavior(
+        if isinstance(transaction_history, TransactionFrame):
+            recent_activities = tuple(transaction_history.recent_records(10))
+        else:
+            recent_activities = tuple(transaction_history[-10:])
+        
+        behavior = ParticipantBehavior(
             address=address,
             participant_type=participant_type,
             behavioral_patterns=behavioral_patterns,
             confidence=confidence,
-            recent_activities=transaction_history[-10:],  # Last 10 activities
+            recent_activities=recent_activities,  # Last 10 activities
             risk_profile=risk_profile,
             influence_score=influence_score,
-            timestamp=datetime.now()
+            timestamp=time.time(),
+            features=features
         )
+        
+        # Bounded profile cache, evicting the oldest participant first
+        if address not in self.participant_profiles and \
+                len(self.participant_profiles) >= self.config['profiles']['max_cached']:
+            del self.participant_profiles[next(iter(self.participant_profiles))]
+        self.participant_profiles[address] = {
+            'history_key': history_key,
+            'features': features,
+            'behavior': behavior
+        }
+        
+        return behavior
 
     async def analyze_market_sentiment(self, 
                                      market_data: Dict,
@@ -130,38 +358,38 @@ class BehavioralModelsAI:
         Behavioral finance-inspired market sentiment analysis
         """
         # Participant sentiment aggregation
-        participant_sentiments = await self._aggregate_participant_sentiments(participant_activities)
+        participant_sentiments = self._aggregate_participant_sentiments(participant_activities)
         
         # Price-based sentiment indicators
-        price_sentiment = await self._analyze_price_sentiment(market_data)
+        price_sentiment = self._analyze_price_sentiment(market_data)
         
         # Volume-based sentiment indicators
-        volume_sentiment = await self._analyze_volume_sentiment(market_data)
+        volume_sentiment = self._analyze_volume_sentiment(market_data)
         
         # Social sentiment indicators (would integrate with external data)
         social_sentiment = await self._analyze_social_sentiment()
         
         # Fear & Greed Index calculation
-        fear_greed_index = await self._calculate_fear_greed_index(
+        fear_greed_index = self._calculate_fear_greed_index(
             price_sentiment, volume_sentiment, social_sentiment
         )
         
         # Overall sentiment determination
-        overall_sentiment = await self._determine_overall_sentiment(
+        overall_sentiment = self._determine_overall_sentiment(
             participant_sentiments, fear_greed_index
         )
         
         # Sentiment momentum
-        sentiment_momentum = await self._calculate_sentiment_momentum()
+        sentiment_momentum = self._calculate_sentiment_momentum()
         
         return MarketSentiment(
             overall_sentiment=overall_sentiment,
             sentiment_score=self._calculate_sentiment_score(participant_sentiments),
             fear_greed_index=fear_greed_index,
             participant_sentiments=participant_sentiments,
-            dominant_behavior=await self._identify_dominant_behavior(participant_activities),
+            dominant_behavior=self._identify_dominant_behavior(participant_activities),
             sentiment_momentum=sentiment_momentum,
-            timestamp=datetime.now()
+            timestamp=time.time()
         )
 
     async def detect_behavioral_anomalies(self, 
@@ -173,23 +401,61 @@ class BehavioralModelsAI:
         anomalies = []
         
         # Trading pattern anomalies
-        pattern_anomalies = await self._detect_pattern_anomalies(current_behavior, historical_patterns)
+        pattern_anomalies = self._detect_pattern_anomalies(current_behavior, historical_patterns)
         anomalies.extend(pattern_anomalies)
         
         # Volume anomalies
-        volume_anomalies = await self._detect_volume_anomalies(current_behavior)
+        volume_anomalies = self._detect_volume_anomalies(current_behavior)
         anomalies.extend(volume_anomalies)
         
         # Timing anomalies
-        timing_anomalies = await self._detect_timing_anomalies(current_behavior)
+        timing_anomalies = self._detect_timing_anomalies(current_behavior)
         anomalies.extend(timing_anomalies)
         
         # Social network anomalies
-        network_anomalies = await self._detect_network_anomalies(current_behavior)
+        network_anomalies = self._detect_network_anomalies(current_behavior)
         anomalies.extend(network_anomalies)
         
         return anomalies
 
+    async def fit_anomaly_detector(self, behaviors: List[ParticipantBehavior]):
+        """
+        Fit the isolation forest on a reference population of participants; detect_anomalies_batch
+        scores against it until the next fit
+        """
+        if not behaviors:
+            raise ValueError("The anomaly detector needs at least one reference participant")
+        self.anomaly_detectors['behavioral'].fit(self._behavior_matrix(behaviors))
+
+    async def detect_anomalies_batch(self, behaviors: List[ParticipantBehavior]) -> List[Dict]:
+        """
+        Score many participants with the isolation forest in a single call (lower score = more anomalous)
+        """
+        detector = self.anomaly_detectors['behavioral']
+        if not hasattr(detector, 'estimators_'):
+            raise RuntimeError("The anomaly detector has no reference population; call fit_anomaly_detector first")
+        if not behaviors:
+            return []
+        
+        scores = detector.score_samples(self._behavior_matrix(behaviors))
+        decisions = scores - detector.offset_
+        
+        return [
+            {
+                'address': behavior.address,
+                'anomaly_score': score,
+                'is_anomaly': decision < 0
+            }
+            for behavior, score, decision in zip(behaviors, scores.tolist(), decisions.tolist())
+        ]
+
+    @staticmethod
+    def _behavior_matrix(behaviors: List[ParticipantBehavior]) -> np.ndarray:
+        """(participants, features) matrix in _BEHAVIORAL_FEATURES order"""
+        # float32 is what the forest's trees split on, so this avoids a converted copy per call
+        return np.array([[behavior.features[name] for name in _BEHAVIORAL_FEATURES]
+                         for behavior in behaviors], dtype=np.float32)
+
     async def predict_participant_actions(self,
                                         participant_behavior: ParticipantBehavior,
                                         market_conditions: Dict) -> List[Dict]:
@@ -199,61 +465,61 @@ class BehavioralModelsAI:
         predictions = []
         
         # Pattern-based prediction
-        pattern_predictions = await self._predict_from_patterns(participant_behavior, market_conditions)
+        pattern_predictions = self._predict_from_patterns(participant_behavior, market_conditions)
         predictions.extend(pattern_predictions)
         
         # Reinforcement learning based prediction
-        rl_predictions = await self._predict_from_rl(participant_behavior, market_conditions)
+        rl_predictions = self._predict_from_rl(participant_behavior, market_conditions)
         predictions.extend(rl_predictions)
         
         # Game theory based prediction
-        game_theory_predictions = await self._predict_from_game_theory(participant_behavior, market_conditions)
+        game_theory_predictions = self._predict_from_game_theory(participant_behavior, market_conditions)
         predictions.extend(game_theory_predictions)
         
         return sorted(predictions, key=lambda x: x['confidence'], reverse=True)[:5]  # Top 5 predictions
 
-    async def _extract_behavioral_features(self, address: str, transaction_history: List[Dict]) -> Dict:
+    def _extract_behavioral_features(self, address: str, transactions: TransactionFrame) -> Dict:
         """
         Extract comprehensive behavioral features
         """
-        features = {}
-        
-        # Trading frequency features
-        features['trading_frequency'] = await self._calculate_trading_frequency(transaction_history)
-        features['session_activity'] = await self._analyze_session_activity(transaction_history)
-        
-        # Position sizing features
-        features['avg_position_size'] = await self._calculate_avg_position_size(transaction_history)
-        features['position_size_volatility'] = await self._calculate_position_volatility(transaction_history)
-        
-        # Holding period features
-        features['avg_holding_period'] = await self._calculate_avg_holding_period(transaction_history)
-        features['holding_period_consistency'] = await self._calculate_holding_consistency(transaction_history)
+        # Trading frequency, position sizing and holding period features
+        features = _columnar_features(transactions)
+        features['session_activity'] = self._analyze_session_activity(transactions)
         
         # Profit-taking behavior
-        features['profit_taking_aggressiveness'] = await self._calculate_profit_taking_behavior(transaction_history)
-        features['loss_cutting_behavior'] = await self._calculate_loss_cutting_behavior(transaction_history)
+        features['profit_taking_aggressiveness'] = self._calculate_profit_taking_behavior(transactions)
+        features['loss_cutting_behavior'] = self._calculate_loss_cutting_behavior(transactions)
         
         # Risk management features
-        features['risk_management_consistency'] = await self._assess_risk_management(transaction_history)
-        features['drawdown_tolerance'] = await self._calculate_drawdown_tolerance(transaction_history)
+        features['risk_management_consistency'] = self._assess_risk_management(transactions)
+        features['drawdown_tolerance'] = self._calculate_drawdown_tolerance(transactions)
         
         return features
 
-    async def _classify_participant_type(self, features: Dict) -> ParticipantType:
+    def _classify_participant_types(self, feature_matrix: np.ndarray) -> List[ParticipantType]:
+        """
+        Rule-based classification of a (participants x _CLASSIFIER_FEATURES) matrix in one vectorized step
+        """
+        frequency = feature_matrix[:, 0]
+        position_size = feature_matrix[:, 1]
+        holding_period = feature_matrix[:, 2]
+        
+        # Same rules and precedence as _classify_participant_type
+        codes = np.select(
+            [frequency > 1000, position_size > 1000000, holding_period < 3600, frequency < 10],
+            [0, 1, 2, 3],
+            default=4
+        )
+        types = (ParticipantType.HFT, ParticipantType.WHALE, ParticipantType.ARBITRAGEUR,
+                 ParticipantType.RETAIL, ParticipantType.INSTITUTIONAL)
+        return [types[code] for code in codes.tolist()]
+
+    def _classify_participant_type(self, features: Dict) -> ParticipantType:
         """
         Classify participant type using machine learning
         """
-        # Feature vector for classification
-        feature_vector = np.array([
-            features['trading_frequency'],
-            features['avg_position_size'],
-            features['avg_holding_period'],
-            features['profit_taking_aggressiveness']
-        ]).reshape(1, -1)
-        
-        # This would use a pre-trained classifier
-        # For now, using rule-based classification
+        # This would use a pre-trained classifier on the _CLASSIFIER_FEATURES vector
+        # For now, using rule-based classification (scalar twin of _classify_participant_types)
         if features['trading_frequency'] > 1000:  # Very high frequency
             return ParticipantType.HFT
         elif features['avg_position_size'] > 1000000:  # Large positions
@@ -265,121 +531,112 @@ class BehavioralModelsAI:
         else:
             return ParticipantType.INSTITUTIONAL
 
-    async def _identify_behavioral_patterns(self, features: Dict, transactions: List[Dict]) -> List[BehavioralPattern]:
+    def _identify_behavioral_patterns(self, features: Dict, transactions: TransactionFrame) -> Tuple[BehavioralPattern, ...]:
         """
         Identify behavioral patterns from transaction history
         """
-        patterns = []
-        
-        # Momentum chasing detection
-        if await self._detect_momentum_chasing(transactions):
-            patterns.append(BehavioralPattern.MOMENTUM_CHASING)
-        
-        # FOMO detection
-        if await self._detect_fomo_behavior(transactions):
-            patterns.append(BehavioralPattern.FEAR_OF_MISSING_OUT)
-        
-        # Panic selling detection
-        if await self._detect_panic_selling(transactions):
-            patterns.append(BehavioralPattern.PANIC_SELLING)
-        
-        # Greed accumulation detection
-        if await self._detect_greed_accumulation(transactions):
-            patterns.append(BehavioralPattern.GREED_ACCUMULATION)
-        
-        # Value investing detection
-        if await self._detect_value_investing(transactions):
-            patterns.append(BehavioralPattern.VALUE_INVESTING)
-        
-        # Arbitrage behavior detection
-        if await self._detect_arbitrage_behavior(transactions):
-            patterns.append(BehavioralPattern.ARBITRAGE_EXECUTION)
-        
-        return patterns
+        return tuple(pattern for pattern, detected in self._scan_patterns(transactions).items() if detected)
 
-    async def _calculate_influence_score(self, features: Dict, transactions: List[Dict]) -> float:
+    def _scan_patterns(self, transactions: TransactionFrame) -> Dict[BehavioralPattern, bool]:
+        """
+        Detect every transaction-level pattern in one pass over the transaction columns
+        """
+        # Only momentum chasing and FOMO have detection rules so far; the others are never flagged
+        return {
+            BehavioralPattern.MOMENTUM_CHASING: len(transactions) > 5,
+            BehavioralPattern.FEAR_OF_MISSING_OUT: bool(transactions.fomo.any()),
+            BehavioralPattern.PANIC_SELLING: False,
+            BehavioralPattern.GREED_ACCUMULATION: False,
+            BehavioralPattern.VALUE_INVESTING: False,
+            BehavioralPattern.ARBITRAGE_EXECUTION: False
+        }
+
+    def _calculate_influence_score(self, features: Dict, transactions: TransactionFrame) -> float:
         """
         Calculate participant influence score
         """
         score_components = []
         
         # Trading volume influence
-        volume_influence = await self._calculate_volume_influence(transactions)
+        volume_influence = self._calculate_volume_influence(transactions)
         score_components.append(volume_influence * 0.3)
         
         # Network influence
-        network_influence = await self._calculate_network_influence(transactions)
+        network_influence = self._calculate_network_influence(transactions)
         score_components.append(network_influence * 0.25)
         
         # Price impact influence
-        price_impact = await self._calculate_price_impact(transactions)
+        price_impact = self._calculate_price_impact(transactions)
         score_components.append(price_impact * 0.25)
         
         # Follow-on activity influence
-        follow_influence = await self._calculate_follow_influence(transactions)
+        follow_influence = self._calculate_follow_influence(transactions)
         score_components.append(follow_influence * 0.2)
         
         return sum(score_components)
 
-    async def _aggregate_participant_sentiments(self, activities: List[Dict]) -> Dict[ParticipantType, float]:
+    def _aggregate_participant_sentiments(self, activities: List[Dict]) -> Dict[ParticipantType, float]:
         """
         Aggregate sentiments across participant types
         """
         sentiments = {}
         
-        for participant_type in ParticipantType:
-            type_activities = [a for a in activities if a.get('participant_type') == participant_type]
+        # Bucket activities by participant type value in a single pass (accepts enum or str)
+        buckets = defaultdict(list)
+        for activity in activities:
+            participant_type = activity.get('participant_type')
+            buckets[_PTYPE_VALUES.get(participant_type, participant_type)].append(activity)
+        
+        for value, participant_type in _PTYPE_BY_VALUE.items():
+            type_activities = buckets.get(value)
             if type_activities:
-                sentiment = await self._calculate_participant_sentiment(type_activities)
+                sentiment = self._calculate_participant_sentiment(type_activities)
                 sentiments[participant_type] = sentiment
         
         return sentiments
 
-    async def _calculate_fear_greed_index(self, 
+    def _calculate_fear_greed_index(self, 
                                         price_sentiment: float, 
                                         volume_sentiment: float, 
                                         social_sentiment: float) -> float:
         """
         Calculate Fear & Greed Index (0-100 scale)
         """
-        components = {
-            'price_momentum': price_sentiment * 25,
-            'market_volatility': (1 - abs(price_sentiment)) * 25,
-            'volume_strength': volume_sentiment * 15,
-            'social_sentiment': social_sentiment * 15,
-            'dominant_behavior': await self._calculate_behavior_sentiment() * 20
-        }
-        
-        return sum(components.values())
+        # Price momentum, market volatility, volume strength, social sentiment, dominant behavior
+        components = np.array([
+            price_sentiment,
+            1 - abs(price_sentiment),
+            volume_sentiment,
+            social_sentiment,
+            self._calculate_behavior_sentiment()
+        ])
+        
+        return float(_FG_WEIGHTS @ components)
 
     def _initialize_models(self):
         """Initialize machine learning models"""
+        # Imported here so importing this module stays cheap for callers that never build the models
+        from sklearn.ensemble import IsolationForest
+        from sklearn.cluster import HDBSCAN
+        
         # Anomaly detection model
         self.anomaly_detectors['behavioral'] = IsolationForest(
+            n_estimators=self.config['anomaly_detection']['n_estimators'],
             contamination=self.config['anomaly_detection']['contamination'],
-            random_state=self.config['anomaly_detection']['random_state']
+            random_state=self.config['anomaly_detection']['random_state'],
+            bootstrap=False,
+            n_jobs=-1
         )
         
-        # Clustering model for participant segmentation
-        self.behavioral_clusters['participant'] = DBSCAN(
-            eps=self.config['clustering']['eps'],
-            min_samples=self.config['clustering']['min_cluster_size']
+        # Clustering model for participant segmentation (density-based, no eps to tune)
+        self.behavioral_clusters['participant'] = HDBSCAN(
+            min_cluster_size=self.config['clustering']['min_cluster_size'],
+            n_jobs=-1
         )
 
-    # Placeholder implementations for detection methods
-    async def _detect_momentum_chasing(self, transactions: List[Dict]) -> bool:
-        """Detect momentum chasing behavior"""
-        # Implementation would analyze buying patterns during price increases
-        return len(transactions) > 5  # Simplified
-
-    async def _detect_fomo_behavior(self, transactions: List[Dict]) -> bool:
-        """Detect Fear Of Missing Out behavior"""
-        # Implementation would analyze rapid buying after price spikes
-        return any(t.get('fomo_indicator', False) for t in transactions)
-
-    async def _calculate_volume_influence(self, transactions: List[Dict]) -> float:
+    def _calculate_volume_influence(self, transactions: TransactionFrame) -> float:
         """Calculate volume-based influence score"""
-        total_volume = sum(t.get('volume', 0) for t in transactions)
+        total_volume = float(transactions.volume.sum())
         return min(total_volume / 1000000, 1.0)  # Normalize to 0-1
 
 # Usage example
@@ -400,8 +657,8 @@ async def main():
         transaction_history
     )
     
-    print(f"Participant Type: {behavior.participant_type.value}")
-    print(f"Behavioral Patterns: {[p.value for p in behavior.behavioral_patterns]}")
+    print(f"Participant Type: {_PTYPE_VALUES[behavior.participant_type]}")
+    print(f"Behavioral Patterns: {[_PATTERN_VALUES[p] for p in behavior.behavioral_patterns]}")
     print(f"Influence Score: {behavior.influence_score:.2f}")
 
 if __name__ == "__main__":
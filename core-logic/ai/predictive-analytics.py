@@ -5,6 +5,14 @@ Institutional-grade market prediction and trend analysis
 """
 
 import asyncio
+import hashlib
+import logging
+import multiprocessing
+import os
+import tempfile
+import time
+from collections import UserDict
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
@@ -16,6 +24,84 @@ from sklearn.ensemble import GradientBoostingRegressor
 from sklearn.preprocessing import StandardScaler
 import xgboost as xgb
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import treelite
+    import tl2cgen
+    TREELITE_AVAILABLE = True
+except ImportError:
+    TREELITE_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+def _rsi_kernel(prices, period):
+    """Wilder-smoothed average gain and loss over the close-to-close changes"""
+    alpha = 1.0 / period
+    delta = prices[1] - prices[0]
+    avg_gain = delta if delta > 0 else 0.0
+    avg_loss = -delta if delta < 0 else 0.0
+    for i in range(2, prices.shape[0]):
+        delta = prices[i] - prices[i - 1]
+        avg_gain = (1.0 - alpha) * avg_gain + alpha * (delta if delta > 0 else 0.0)
+        avg_loss = (1.0 - alpha) * avg_loss + alpha * (-delta if delta < 0 else 0.0)
+    return avg_gain, avg_loss
+
+def _atr_kernel(high, low, close, period):
+    """Wilder-smoothed true range"""
+    alpha = 1.0 / period
+    atr = high[0] - low[0]
+    for i in range(1, close.shape[0]):
+        true_range = max(high[i] - low[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+        atr = (1.0 - alpha) * atr + alpha * true_range
+    return atr
+
+def _obv_kernel(close, volume):
+    """On-balance volume: volume added on up closes, subtracted on down closes"""
+    obv = 0.0
+    for i in range(1, close.shape[0]):
+        if close[i] > close[i - 1]:
+            obv += volume[i]
+        elif close[i] < close[i - 1]:
+            obv -= volume[i]
+    return obv
+
+if NUMBA_AVAILABLE:
+    _rsi_kernel = njit(_rsi_kernel)
+    _atr_kernel = njit(_atr_kernel)
+    _obv_kernel = njit(_obv_kernel)
+
+# Timeframe lengths and their pandas frequencies
+_TIMEFRAME_SECONDS = {'15m': 900, '1h': 3600, '4h': 14400, '1d': 86400}
+_TIMEFRAME_FREQ = {'15m': '15min', '1h': 'h', '4h': '4h', '1d': 'D'}
+
+def _prophet_forecast(model, timeframe: str) -> float:
+    """Next-step forecast from a fitted Prophet model"""
+    future = model.make_future_dataframe(periods=1, freq=_TIMEFRAME_FREQ.get(timeframe, 'h'),
+                                         include_history=False)
+    return float(model.predict(future)['yhat'].iloc[-1])
+
+def _arima_forecast(model, timeframe: str) -> float:
+    """Next-step forecast from fitted ARIMA results"""
+    return float(np.asarray(model.forecast(steps=1))[-1])
+
+_FORECASTERS = {'prophet': _prophet_forecast, 'arima': _arima_forecast}
+
+# Models resident in a forecast worker process, keyed (kind, asset id, timeframe id)
+_worker_models: Dict[Tuple[str, int, int], object] = {}
+
+def _init_forecast_worker(models: Dict[Tuple[str, int, int], object]):
+    """Forecast worker initializer: the models stay loaded for the worker's lifetime"""
+    _worker_models.update(models)
+
+def _forecast_in_worker(key: Tuple[str, int, int], timeframe: str) -> float:
+    """Next-step forecast from the worker's resident model for key"""
+    return _FORECASTERS[key[0]](_worker_models[key], timeframe)
+
 class MarketRegime(Enum):
     BULL = "bull"
     BEAR = "bear" 
@@ -30,6 +116,21 @@ class PredictionConfidence(Enum):
     LOW = 0.55
     VERY_LOW = 0.40
 
+_REGIME_CODES = {regime: code for code, regime in enumerate(MarketRegime)}
+
+# Column layout of a prediction batch (see PredictiveAnalyticsEngine._update_performance_metrics)
+PREDICTION_DTYPE = np.dtype([
+    ('predicted_price', 'f4'),
+    ('confidence', 'f4'),
+    ('interval_lo', 'f4'),
+    ('interval_hi', 'f4'),
+    ('regime', 'u1'),  # _REGIME_CODES
+    ('timestamp', 'i8')  # epoch nanoseconds
+])
+
+# Ensemble model names -> model registry kinds
+_MODEL_KINDS = {'xgboost': 'xgb', 'lstm': 'lstm', 'prophet': 'prophet', 'arima': 'arima'}
+
 @dataclass
 class MarketPrediction:
     """Palantir Foundry-inspired prediction structure"""
@@ -56,6 +157,90 @@ class TradingSignal:
     stop_loss: float
     timestamp: datetime
 
+class _TFLiteModel:
+    """
+    predict()-compatible wrapper serving single rows from a batch-size-1 TFLite model
+    and larger batches from the model's Keras graph
+    """
+    
+    def __init__(self, model_content: bytes, batch_model: '_KerasGraphModel'):
+        self.interpreter = tf.lite.Interpreter(model_content=model_content)
+        self.interpreter.allocate_tensors()
+        self._input_index = self.interpreter.get_input_details()[0]['index']
+        self._output_index = self.interpreter.get_output_details()[0]['index']
+        self.batch_model = batch_model
+    
+    def predict(self, batch: np.ndarray, batch_size: Optional[int] = None) -> np.ndarray:
+        # The LSTM only converts with a static batch of 1 (no resizing), so batches take the graph path
+        if len(batch) != 1:
+            return self.batch_model.predict(batch, batch_size)
+        self.interpreter.set_tensor(self._input_index, batch.astype(np.float32, copy=False))
+        self.interpreter.invoke()
+        return self.interpreter.get_tensor(self._output_index)
+
+class _KerasGraphModel:
+    """predict()-compatible wrapper calling a Keras model through a traced tf.function"""
+    
+    def __init__(self, model: tf.keras.Model, input_dtype: tf.DType = tf.float32):
+        self.model = model
+        self._input_dtype = input_dtype
+        
+        # Any batch size, fixed (timesteps, features): one concrete graph serves every call,
+        # XLA-compiled so the LSTM cell's matmuls and activations fuse into single kernels
+        timesteps, n_features = model.input_shape[1:]
+        signature = [tf.TensorSpec([None, timesteps, n_features], input_dtype)]
+        warmup = tf.zeros([1, timesteps, n_features], dtype=input_dtype)
+        
+        # Trace (and compile) up front so the first prediction doesn't pay for it
+        try:
+            self._infer = tf.function(lambda x: model(x, training=False), input_signature=signature,
+                                      jit_compile=True)
+            self._infer(warmup)
+        except (tf.errors.InvalidArgumentError, tf.errors.UnimplementedError) as e:
+            logger.warning("XLA compilation unavailable for LSTM, using the plain graph: %s", e)
+            self._infer = tf.function(lambda x: model(x, training=False), input_signature=signature)
+            self._infer(warmup)
+    
+    def predict(self, batch: np.ndarray, batch_size: Optional[int] = None) -> np.ndarray:
+        outputs = self._infer(tf.convert_to_tensor(batch, dtype=self._input_dtype))
+        return outputs.numpy().astype(np.float32, copy=False)
+
+class _CompiledTreeModel:
+    """predict()-compatible wrapper around a tree ensemble compiled to native code by Treelite"""
+    
+    def __init__(self, predictor: 'tl2cgen.Predictor'):
+        self.predictor = predictor
+    
+    def predict(self, batch: np.ndarray) -> np.ndarray:
+        return self.predictor.predict(tl2cgen.DMatrix(batch)).reshape(len(batch))
+
+class _ModelRegistry(UserDict):
+    """
+    Model registry keyed '{kind}_{asset}_{timeframe}'; every write and delete, however it is
+    made, is passed on so the engine's dense model tables stay in step
+    """
+    
+    def __init__(self, on_change):
+        self._on_change = on_change
+        super().__init__()
+    
+    @staticmethod
+    def _split_key(key: str) -> Tuple[str, str, str]:
+        kind, _, rest = key.partition('_')
+        asset, _, timeframe = rest.rpartition('_')
+        if not (kind and asset and timeframe):
+            raise KeyError(f"Model registry keys are '{{kind}}_{{asset}}_{{timeframe}}', got {key!r}")
+        return kind, asset, timeframe
+    
+    def __setitem__(self, key: str, model):
+        kind, asset, timeframe = self._split_key(key)
+        super().__setitem__(key, model)
+        self._on_change(kind, asset, timeframe, model)
+    
+    def __delitem__(self, key: str):
+        super().__delitem__(key)
+        self._on_change(*self._split_key(key), None)
+
 class PredictiveAnalyticsEngine:
     """
     Palantir Foundry + Bloomberg Terminal inspired analytics
@@ -63,7 +248,24 @@ class PredictiveAnalyticsEngine:
     """
     
     def __init__(self):
-        self.model_registry = {}
+        # The registry is the source of truth; the dense model tables for the hot path,
+        # self._models[kind][asset_id][timeframe_id], follow every change to it (see _index_model)
+        self.model_registry = _ModelRegistry(self._index_model)
+        self._asset_ids: Dict[str, int] = {}
+        self._tf_ids: Dict[str, int] = {}
+        self._timeframes: List[str] = []
+        self._models: Dict[str, List[List[object]]] = {}
+        
+        # LSTMs run as mixed-precision graphs on a GPU when there is one, quantized TFLite otherwise
+        self._gpu = bool(tf.config.list_physical_devices('GPU'))
+        
+        # Prophet/ARIMA forecasts are slow, so each pair's is reused until it expires
+        self._forecast_cache: Dict[Tuple[str, int, int], Tuple[float, float]] = {}  # -> (prediction, expiry)
+        self._forecast_locks: Dict[Tuple[str, int, int], asyncio.Lock] = {}
+        
+        # Forecasts hold the GIL, so they run in worker processes (pool created on first use,
+        # restarted when a Prophet/ARIMA model is registered)
+        self._forecast_pool: Optional[ProcessPoolExecutor] = None
         self.feature_engine = FeatureEngine()
         self.regime_detector = MarketRegimeDetector()
         self.anomaly_detector = AnomalyDetector()
@@ -74,7 +276,9 @@ class PredictiveAnalyticsEngine:
                 'model_type': 'xgb',
                 'features': ['price', 'volume', 'volatility', 'sentiment'],
                 'lookback_window': 100,
-                'prediction_horizon': 10
+                'prediction_horizon': 10,
+                'inference_threads': 1,  # per compiled model; latency over throughput
+                'ensemble_weights': {'xgboost': 0.4, 'lstm': 0.3, 'prophet': 0.15, 'arima': 0.15}
             },
             'regime_classification': {
                 'model_type': 'lstm',
@@ -96,6 +300,11 @@ class PredictiveAnalyticsEngine:
             'accuracy_1d': 0.0,
             'model_confidence': 0.0
         }
+        
+        # Latest prediction batch as columns (PREDICTION_DTYPE) with categorical asset/timeframe keys
+        self.prediction_columns = np.empty(0, dtype=PREDICTION_DTYPE)
+        self.prediction_assets = pd.Categorical([])
+        self.prediction_timeframes = pd.Categorical([])
 
     async def generate_market_predictions(self, 
                                         market_data: Dict,
@@ -105,11 +314,25 @@ class PredictiveAnalyticsEngine:
         Palantir Foundry-inspired multi-asset predictions
         """
         predictions = {}
+        # One timestamp stamps the whole batch
+        now = datetime.now()
         
-        for asset in assets:
-            for timeframe in timeframes:
-                prediction = await self._predict_asset_price(asset, timeframe, market_data)
-                predictions[f"{asset}_{timeframe}"] = prediction
+        # Every (asset, timeframe) pair goes through the models as one batch
+        pairs = [(asset, timeframe) for asset in assets for timeframe in timeframes]
+        features = await asyncio.gather(*(
+            self.feature_engine.extract_features(asset, timeframe, market_data) for asset, timeframe in pairs
+        ))
+        model_predictions = await self._run_model_ensemble(np.stack(features), pairs) if pairs else []
+        
+        # Regimes depend only on the asset's data, so each asset's is detected once
+        regimes = dict(zip(assets, await asyncio.gather(*(
+            self.regime_detector.detect_regime(market_data[asset]) for asset in assets
+        ))))
+        
+        for (asset, timeframe), pair_features, pair_predictions in zip(pairs, features, model_predictions):
+            predictions[f"{asset}_{timeframe}"] = await self._predict_asset_price(
+                asset, timeframe, pair_features, pair_predictions, regimes[asset], timestamp=now
+            )
         
         # Ensemble predictions (Bloomberg Terminal approach)
         ensemble_predictions = await self._ensemble_predictions(predictions)
@@ -126,12 +349,13 @@ class PredictiveAnalyticsEngine:
         Bloomberg Terminal-inspired trading signal generation
         """
         signals = []
+        now = datetime.now()
         
         # Multi-timeframe analysis
         timeframes = ['15m', '1h', '4h', '1d']
         
         for asset in portfolio_context['watchlist']:
-            asset_signals = await self._analyze_asset_signals(asset, timeframes, market_data)
+            asset_signals = await self._analyze_asset_signals(asset, timeframes, market_data, timestamp=now)
             signals.extend(asset_signals)
         
         # Risk-adjusted signal filtering
@@ -146,11 +370,9 @@ class PredictiveAnalyticsEngine:
         """
         Detect current market regimes across assets
         """
-        regime_predictions = {}
-        
-        for asset, data in market_data.items():
-            regime = await self.regime_detector.detect_regime(data)
-            regime_predictions[asset] = regime
+        # Assets are independent, so their regimes are detected concurrently
+        regimes = await asyncio.gather(*(self.regime_detector.detect_regime(data) for data in market_data.values()))
+        regime_predictions = dict(zip(market_data, regimes))
         
         # Cross-asset regime consistency
         overall_regime = await self._determine_overall_regime(regime_predictions)
@@ -167,41 +389,46 @@ class PredictiveAnalyticsEngine:
         """
         Calculate institutional-grade risk metrics
         """
-        risk_metrics = {}
-        
-        # Value at Risk calculations (JPMorgan patterns)
-        risk_metrics['var_95'] = await self._calculate_var(market_data, portfolio, 0.95)
-        risk_metrics['var_99'] = await self._calculate_var(market_data, portfolio, 0.99)
-        
-        # Conditional VaR (Expected Shortfall)
-        risk_metrics['cvar_95'] = await self._calculate_cvar(market_data, portfolio, 0.95)
-        
-        # Maximum Drawdown
-        risk_metrics['max_drawdown'] = await self._calculate_max_drawdown(portfolio)
-        
-        # Sharpe Ratio
-        risk_metrics['sharpe_ratio'] = await self._calculate_sharpe_ratio(portfolio)
-        
-        # Stress Testing
-        risk_metrics['stress_scenarios'] = await self._run_stress_tests(market_data, portfolio)
+        # The metrics are independent of each other, so they run concurrently
+        var_95, var_99, cvar_95, max_drawdown, sharpe_ratio, stress_scenarios = await asyncio.gather(
+            # Value at Risk calculations (JPMorgan patterns)
+            self._calculate_var(market_data, portfolio, 0.95),
+            self._calculate_var(market_data, portfolio, 0.99),
+            
+            # Conditional VaR (Expected Shortfall)
+            self._calculate_cvar(market_data, portfolio, 0.95),
+            
+            # Maximum Drawdown
+            self._calculate_max_drawdown(portfolio),
+            
+            # Sharpe Ratio
+            self._calculate_sharpe_ratio(portfolio),
+            
+            # Stress Testing
+            self._run_stress_tests(market_data, portfolio)
+        )
         
-        return risk_metrics
+        return {
+            'var_95': var_95,
+            'var_99': var_99,
+            'cvar_95': cvar_95,
+            'max_drawdown': max_drawdown,
+            'sharpe_ratio': sharpe_ratio,
+            'stress_scenarios': stress_scenarios
+        }
 
     async def _predict_asset_price(self, 
                                  asset: str, 
                                  timeframe: str,
-                                 market_data: Dict) -> MarketPrediction:
+                                 features: np.ndarray,
+                                 model_predictions: Dict,
+                                 regime: MarketRegime,
+                                 timestamp: Optional[datetime] = None) -> MarketPrediction:
         """
-        Palantir Foundry-inspired price prediction
+        Palantir Foundry-inspired price prediction from the pair's batched features,
+        ensemble output and asset regime
         """
-        # Feature engineering
-        features = await self.feature_engine.extract_features(asset, timeframe, market_data)
-        
-        # Multi-model prediction ensemble
-        model_predictions = await self._run_model_ensemble(features, asset, timeframe)
-        
         # Regime-aware prediction adjustment
-        regime = await self.regime_detector.detect_regime(market_data[asset])
         adjusted_prediction = await self._adjust_for_regime(model_predictions, regime)
         
         # Confidence calculation
@@ -222,15 +449,15 @@ class PredictiveAnalyticsEngine:
             regime=regime,
             key_drivers=key_drivers,
             risk_factors=await self._identify_risk_factors(features),
-            timestamp=datetime.now()
+            timestamp=timestamp or datetime.now()
         )
 
     async def _run_model_ensemble(self, 
-                                features: pd.DataFrame,
-                                asset: str,
-                                timeframe: str) -> Dict[str, float]:
+                                features: np.ndarray,
+                                pairs: List[Tuple[str, str]]) -> List[Dict]:
         """
-        Ensemble of multiple prediction models
+        Ensemble of multiple prediction models over a batch of (asset, timeframe) pairs
+        (one feature matrix row each), one ensemble result per pair
         """
         models = {
             'xgboost': self._run_xgboost_model,
@@ -239,39 +466,77 @@ class PredictiveAnalyticsEngine:
             'arima': self._run_arima_model
         }
         
-        predictions = {}
+        # Each model predicts the whole batch at once, models looked up by ids resolved here
+        pair_ids = self._pair_ids(pairs)
+        batch_predictions = {}
         
         for model_name, model_func in models.items():
-            try:
-                prediction = await model_func(features, asset, timeframe)
-                predictions[model_name] = prediction
-            except Exception as e:
-                print(f"Model {model_name} failed: {e}")
+            # Kinds with nothing registered would only predict 0.0 for every pair
+            if _MODEL_KINDS[model_name] not in self._models:
                 continue
+            try:
+                batch_predictions[model_name] = await model_func(features, pair_ids)
+            except (KeyError, ValueError, RuntimeError, tf.errors.InvalidArgumentError) as e:
+                # A failed model is left out; the models that succeeded share its weight
+                logger.warning("Model %s failed: %s", model_name, e)
         
-        # Weighted ensemble average (Bloomberg approach)
-        ensemble_weights = await self._calculate_ensemble_weights(predictions, asset, timeframe)
-        ensemble_prediction = self._weighted_average(predictions, ensemble_weights)
+        # Weighted ensemble average (Bloomberg approach) for every pair at once: (models, pairs)
+        model_names = list(batch_predictions)
+        predictions = np.array([batch_predictions[model_name] for model_name in model_names]).reshape(
+            len(model_names), len(pairs)
+        )
+        weights = self._calculate_ensemble_weights(model_names, pair_ids)
+        ensemble_predictions = self._weighted_average(predictions, weights)
         
-        return {
-            'ensemble': ensemble_prediction,
-            'individual': predictions,
-            'weights': ensemble_weights
-        }
+        return [
+            {
+                'ensemble': ensemble_prediction,
+                'individual': dict(zip(model_names, pair_predictions)),
+                'weights': dict(zip(model_names, pair_weights))
+            }
+            for ensemble_prediction, pair_predictions, pair_weights in zip(
+                ensemble_predictions.tolist(), predictions.T.tolist(), weights.T.tolist()
+            )
+        ]
+
+    def _calculate_ensemble_weights(self,
+                                    model_names: List[str],
+                                    pair_ids: List[Optional[Tuple[int, int]]]) -> np.ndarray:
+        """
+        (models, pairs) ensemble weights: each model's configured weight where the pair has that
+        model registered, normalized per pair (all zero for pairs with no models)
+        """
+        base_weights = self.model_configs['price_prediction']['ensemble_weights']
+        weights = np.zeros((len(model_names), len(pair_ids)))
+        for m, model_name in enumerate(model_names):
+            table = self._models.get(_MODEL_KINDS[model_name])
+            if table is None:
+                continue
+            registered = [ids is not None and table[ids[0]][ids[1]] is not None for ids in pair_ids]
+            weights[m] = np.where(registered, base_weights[model_name], 0.0)
+        
+        totals = weights.sum(axis=0)
+        return np.divide(weights, totals, out=np.zeros_like(weights), where=totals > 0)
+
+    @staticmethod
+    def _weighted_average(predictions: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        """Per-pair weighted average of (models, pairs) predictions under normalized weights"""
+        return (predictions * weights).sum(axis=0)
 
     async def _analyze_asset_signals(self,
                                    asset: str,
                                    timeframes: List[str],
-                                   market_data: Dict) -> List[TradingSignal]:
+                                   market_data: Dict,
+                                   timestamp: Optional[datetime] = None) -> List[TradingSignal]:
         """
         Multi-timeframe technical analysis (Bloomberg patterns)
         """
         signals = []
         
+        # Technical indicators read the asset's one close series, so every timeframe shares a single pass
+        technicals = await self._calculate_technical_indicators(asset, market_data)
+        
         for timeframe in timeframes:
-            # Technical indicators
-            technicals = await self._calculate_technical_indicators(asset, timeframe, market_data)
-            
             # Pattern recognition
             patterns = await self._detect_chart_patterns(asset, timeframe, market_data)
             
@@ -280,7 +545,7 @@ class PredictiveAnalyticsEngine:
             
             # Generate signal
             signal = await self._generate_signal_from_analysis(
-                asset, timeframe, technicals, patterns, momentum
+                asset, timeframe, technicals, patterns, momentum, timestamp=timestamp
             )
             
             if signal:
@@ -290,20 +555,23 @@ class PredictiveAnalyticsEngine:
 
     async def _calculate_technical_indicators(self,
                                             asset: str,
-                                            timeframe: str,
                                             market_data: Dict) -> Dict[str, float]:
         """
-        Bloomberg Terminal-inspired technical indicators
+        Bloomberg Terminal-inspired technical indicators over the asset's close series
         """
-        prices = market_data[asset]['close']
+        # One float array view of the closes shared by every indicator
+        prices = np.asarray(market_data[asset]['close'], dtype=np.float64)
+        sma_20 = self._calculate_sma(prices, 20)
+        ema_12 = self._ema_series(prices, 12)
+        ema_26 = self._ema_series(prices, 26)
         
         indicators = {
             # Trend indicators
-            'sma_20': self._calculate_sma(prices, 20),
+            'sma_20': sma_20,
             'sma_50': self._calculate_sma(prices, 50),
-            'ema_12': self._calculate_ema(prices, 12),
-            'ema_26': self._calculate_ema(prices, 26),
-            'macd': self._calculate_macd(prices),
+            'ema_12': float(ema_12[-1]),
+            'ema_26': float(ema_26[-1]),
+            'macd': self._calculate_macd(ema_12, ema_26),
             
             # Momentum indicators
             'rsi': self._calculate_rsi(prices),
@@ -311,7 +579,7 @@ class PredictiveAnalyticsEngine:
             'williams_r': self._calculate_williams_r(prices),
             
             # Volatility indicators
-            'bollinger_bands': self._calculate_bollinger_bands(prices),
+            'bollinger_bands': self._calculate_bollinger_bands(prices, sma_20),
             'atr': self._calculate_atr(market_data[asset]),
             
             # Volume indicators
@@ -321,36 +589,367 @@ class PredictiveAnalyticsEngine:
         
         return indicators
 
-    async def _run_xgboost_model(self, features: pd.DataFrame, asset: str, timeframe: str) -> float:
-        """XGBoost model implementation"""
-        # Implementation would load trained model and make prediction
-        model = self.model_registry.get(f'xgb_{asset}_{timeframe}')
-        if model:
-            prediction = model.predict(features)
-            return float(prediction[0])
-        return 0.0
-
-    async def _run_lstm_model(self, features: pd.DataFrame, asset: str, timeframe: str) -> float:
-        """LSTM model implementation"""
-        # Implementation would use TensorFlow for sequence prediction
-        model = self.model_registry.get(f'lstm_{asset}_{timeframe}')
-        if model:
-            prediction = model.predict(features.values.reshape(1, features.shape[0], features.shape[1]))
-            return float(prediction[0][0])
-        return 0.0
+    @staticmethod
+    def _calculate_sma(prices: np.ndarray, period: int) -> float:
+        """Simple moving average over the latest period closes (all of them if fewer)"""
+        return float(prices[-period:].mean())
+
+    @staticmethod
+    def _ema_series(values: np.ndarray, period: int) -> np.ndarray:
+        """Exponential moving average series (span=period, recursive form)"""
+        return pd.Series(values).ewm(span=period, adjust=False).mean().to_numpy()
+
+    def _calculate_macd(self, ema_12: np.ndarray, ema_26: np.ndarray) -> Dict[str, float]:
+        """MACD line, 9-period signal line and histogram from the 12/26 EMA series"""
+        macd_line = ema_12 - ema_26
+        signal_line = self._ema_series(macd_line, 9)
+        return {
+            'macd': float(macd_line[-1]),
+            'signal': float(signal_line[-1]),
+            'histogram': float(macd_line[-1] - signal_line[-1])
+        }
+
+    @staticmethod
+    def _calculate_rsi(prices: np.ndarray, period: int = 14) -> float:
+        """Relative Strength Index with Wilder smoothing (0-100)"""
+        if len(prices) < 2:
+            return 50.0
+        if NUMBA_AVAILABLE:
+            avg_gain, avg_loss = _rsi_kernel(prices, period)
+        else:
+            deltas = np.diff(prices)
+            gains = np.where(deltas > 0, deltas, 0.0)
+            losses = np.where(deltas < 0, -deltas, 0.0)
+            avg_gain = pd.Series(gains).ewm(alpha=1 / period, adjust=False).mean().iloc[-1]
+            avg_loss = pd.Series(losses).ewm(alpha=1 / period, adjust=False).mean().iloc[-1]
+        if avg_loss == 0:
+            return 100.0 if avg_gain > 0 else 50.0
+        return float(100 - 100 / (1 + avg_gain / avg_loss))
+
+    @staticmethod
+    def _calculate_atr(asset_data: Dict, period: int = 14) -> float:
+        """Average True Range with Wilder smoothing"""
+        high = np.asarray(asset_data['high'], dtype=np.float64)
+        low = np.asarray(asset_data['low'], dtype=np.float64)
+        close = np.asarray(asset_data['close'], dtype=np.float64)
+        if NUMBA_AVAILABLE:
+            return float(_atr_kernel(high, low, close, period))
+        prev_close = np.concatenate((close[:1], close[:-1]))
+        true_range = np.maximum.reduce([high - low, np.abs(high - prev_close), np.abs(low - prev_close)])
+        true_range[0] = high[0] - low[0]
+        return float(pd.Series(true_range).ewm(alpha=1 / period, adjust=False).mean().iloc[-1])
+
+    @staticmethod
+    def _calculate_obv(asset_data: Dict) -> float:
+        """On-balance volume over the series"""
+        close = np.asarray(asset_data['close'], dtype=np.float64)
+        volume = np.asarray(asset_data['volume'], dtype=np.float64)
+        if NUMBA_AVAILABLE:
+            return float(_obv_kernel(close, volume))
+        return float(np.dot(np.sign(np.diff(close)), volume[1:]))
+
+    @staticmethod
+    def _calculate_stochastic(prices: np.ndarray, period: int = 14) -> float:
+        """Stochastic %K of the latest close within the period's closing range (0-100)"""
+        window = prices[-period:]
+        low, high = window.min(), window.max()
+        return float((prices[-1] - low) / (high - low) * 100) if high > low else 50.0
+
+    @staticmethod
+    def _calculate_williams_r(prices: np.ndarray, period: int = 14) -> float:
+        """Williams %R of the latest close within the period's closing range (-100-0)"""
+        window = prices[-period:]
+        low, high = window.min(), window.max()
+        return float((prices[-1] - high) / (high - low) * 100) if high > low else -50.0
+
+    @staticmethod
+    def _calculate_bollinger_bands(prices: np.ndarray, middle: float,
+                                   period: int = 20, num_std: float = 2.0) -> Dict[str, float]:
+        """Bollinger Bands around the period SMA (middle), width from the window's std"""
+        band = num_std * float(prices[-period:].std())
+        return {'upper': middle + band, 'middle': middle, 'lower': middle - band}
+
+    def register_model(self, kind: str, asset: str, timeframe: str, model):
+        """Register a pair's model of the given kind ('xgb', 'lstm', 'prophet', 'arima')"""
+        self.model_registry[f'{kind}_{asset}_{timeframe}'] = model
+
+    def _index_model(self, kind: str, asset: str, timeframe: str, model):
+        """
+        Mirror a model registry change (model None when removed) into the dense tables,
+        giving new assets and timeframes the next integer id
+        """
+        if asset not in self._asset_ids:
+            self._asset_ids[asset] = len(self._asset_ids)
+            for table in self._models.values():
+                table.append([None] * len(self._timeframes))
+        if timeframe not in self._tf_ids:
+            self._tf_ids[timeframe] = len(self._timeframes)
+            self._timeframes.append(timeframe)
+            for table in self._models.values():
+                for row in table:
+                    row.append(None)
+        if kind not in self._models:
+            self._models[kind] = [[None] * len(self._timeframes) for _ in self._asset_ids]
+        
+        self._models[kind][self._asset_ids[asset]][self._tf_ids[timeframe]] = model
+        
+        if kind in _FORECASTERS:
+            # Workers hold the models they started with; the next forecast starts a fresh pool
+            self._forecast_cache.pop((kind, self._asset_ids[asset], self._tf_ids[timeframe]), None)
+            if self._forecast_pool is not None:
+                self._forecast_pool.shutdown(wait=False)
+                self._forecast_pool = None
+
+    def _pair_ids(self, pairs: List[Tuple[str, str]]) -> List[Optional[Tuple[int, int]]]:
+        """(asset id, timeframe id) for each pair, None where nothing is registered for it"""
+        asset_ids, tf_ids = self._asset_ids, self._tf_ids
+        pair_ids = []
+        for asset, timeframe in pairs:
+            asset_id, tf_id = asset_ids.get(asset), tf_ids.get(timeframe)
+            pair_ids.append(None if asset_id is None or tf_id is None else (asset_id, tf_id))
+        return pair_ids
+
+    def register_lstm_model(self,
+                            asset: str,
+                            timeframe: str,
+                            model: tf.keras.Model,
+                            quantize: Optional[str] = 'int8'):
+        """
+        Register a pair's LSTM. On a GPU host it runs in mixed precision (float16 compute on
+        tensor cores); on CPU it is served as a post-training quantized TFLite model: 'int8'
+        (default) or 'float16' weights, None keeps float32 Keras inference
+        """
+        if self._gpu:
+            model = self._mixed_precision_lstm(model)
+        elif quantize:
+            model = self._quantize_lstm(model, quantize)
+        else:
+            model = _KerasGraphModel(model)
+        self.register_model('lstm', asset, timeframe, model)
+
+    @staticmethod
+    def _mixed_precision_lstm(model: tf.keras.Model) -> _KerasGraphModel:
+        """Rebuild the model under the mixed_float16 policy with its trained weights"""
+        # Layer configs pin their dtype, so it is dropped to let the global policy apply
+        def clone_layer(layer):
+            return layer.__class__.from_config({**layer.get_config(), 'dtype': None})
+        
+        policy = tf.keras.mixed_precision.global_policy()
+        tf.keras.mixed_precision.set_global_policy('mixed_float16')
+        try:
+            mixed_model = tf.keras.models.clone_model(model, clone_function=clone_layer)
+        finally:
+            tf.keras.mixed_precision.set_global_policy(policy)
+        mixed_model.set_weights(model.get_weights())
+        return _KerasGraphModel(mixed_model, input_dtype=tf.float16)
+
+    @staticmethod
+    def _quantize_lstm(model: tf.keras.Model, precision: str) -> _TFLiteModel:
+        """
+        Post-training quantization: 'int8' is dynamic-range (int8 weights, activations
+        quantized on the fly), 'float16' stores half-precision weights
+        """
+        # Exported with a static batch of 1 so the LSTM lowers to the fused TFLite op
+        timesteps, n_features = model.input_shape[1:]
+        with tempfile.TemporaryDirectory() as export_dir:
+            model.export(export_dir, input_signature=[tf.TensorSpec([1, timesteps, n_features], tf.float32)])
+            converter = tf.lite.TFLiteConverter.from_saved_model(export_dir)
+            converter.optimizations = [tf.lite.Optimize.DEFAULT]
+            if precision == 'float16':
+                converter.target_spec.supported_types = [tf.float16]
+            return _TFLiteModel(converter.convert(), _KerasGraphModel(model))
+
+    def register_xgboost_model(self, asset: str, timeframe: str, model: xgb.XGBModel, compile: bool = True):
+        """
+        Register a pair's XGBoost model, compiled to a native tree predictor when Treelite is installed
+        """
+        if compile and TREELITE_AVAILABLE:
+            model = self._compile_trees(model)
+        self.register_model('xgb', asset, timeframe, model)
+
+    def _compile_trees(self, model: xgb.XGBModel) -> _CompiledTreeModel:
+        """Compile the booster's trees into a shared library and load it"""
+        trees = treelite.frontend.from_xgboost(model.get_booster())
+        with tempfile.TemporaryDirectory() as build_dir:
+            libpath = f'{build_dir}/trees.so'
+            tl2cgen.export_lib(trees, toolchain='gcc', libpath=libpath, params={'parallel_comp': 8})
+            predictor = tl2cgen.Predictor(
+                libpath, nthread=self.model_configs['price_prediction']['inference_threads']
+            )
+        return _CompiledTreeModel(predictor)
+
+    async def _run_prophet_model(self, features: np.ndarray, pair_ids: List[Optional[Tuple[int, int]]]) -> List[float]:
+        """Prophet model implementation (0.0 for pairs without a model)"""
+        return await self._run_cached_forecasts('prophet', pair_ids)
+
+    async def _run_arima_model(self, features: np.ndarray, pair_ids: List[Optional[Tuple[int, int]]]) -> List[float]:
+        """ARIMA model implementation (0.0 for pairs without a model)"""
+        return await self._run_cached_forecasts('arima', pair_ids)
+
+    async def _run_cached_forecasts(self, kind: str, pair_ids: List[Optional[Tuple[int, int]]]) -> List[float]:
+        """Each pair's forecast, served from the cache while it is fresh"""
+        table = self._models.get(kind)
+        if table is None:
+            return [0.0] * len(pair_ids)
+        return list(await asyncio.gather(*(
+            self._cached_forecast(kind, table, ids) for ids in pair_ids
+        )))
+
+    async def _cached_forecast(self, kind: str, table: List[List[object]],
+                               ids: Optional[Tuple[int, int]]) -> float:
+        """A pair's forecast, recomputed at most once per quarter of its timeframe"""
+        if ids is None:
+            return 0.0
+        asset_id, tf_id = ids
+        key = (kind, asset_id, tf_id)
+        cached = self._forecast_cache.get(key)
+        if cached and cached[1] > time.time():
+            return cached[0]
+        
+        model = table[asset_id][tf_id]
+        if not model:
+            return 0.0
+        timeframe = self._timeframes[tf_id]
+        
+        # One refresh per pair; concurrent callers wait for it instead of forecasting again
+        async with self._forecast_locks.setdefault(key, asyncio.Lock()):
+            cached = self._forecast_cache.get(key)
+            if cached and cached[1] > time.time():
+                return cached[0]
+            prediction = await asyncio.get_running_loop().run_in_executor(
+                self._get_forecast_pool(), _forecast_in_worker, key, timeframe
+            )
+            expiry = time.time() + _TIMEFRAME_SECONDS.get(timeframe, 3600) / 4
+            self._forecast_cache[key] = (prediction, expiry)
+        
+        return prediction
+
+    def _get_forecast_pool(self) -> ProcessPoolExecutor:
+        """The forecast worker pool, started with every registered Prophet/ARIMA model resident"""
+        if self._forecast_pool is None:
+            models = {
+                (kind, asset_id, tf_id): model
+                for kind in _FORECASTERS
+                for asset_id, row in enumerate(self._models.get(kind, ()))
+                for tf_id, model in enumerate(row) if model
+            }
+            # forkserver, not fork: workers must not inherit TensorFlow's threads and held locks
+            self._forecast_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context('forkserver'),
+                initializer=_init_forecast_worker,
+                initargs=(models,),
+            )
+        return self._forecast_pool
+
+    def _rows_by_model(self, kind: str, pair_ids: List[Optional[Tuple[int, int]]]) -> List[Tuple[object, List[int]]]:
+        """Registered models of a kind for the batch's pairs, each with the batch rows it serves"""
+        table = self._models.get(kind)
+        if table is None:
+            return []
+        groups = {}
+        for row, ids in enumerate(pair_ids):
+            if ids is None:
+                continue
+            model = table[ids[0]][ids[1]]
+            if model:
+                groups.setdefault(id(model), (model, []))[1].append(row)
+        return list(groups.values())
+
+    async def _run_xgboost_model(self, features: np.ndarray, pair_ids: List[Optional[Tuple[int, int]]]) -> List[float]:
+        """XGBoost model implementation (0.0 for pairs without a model)"""
+        # One predict call per distinct model over all the rows it serves
+        predictions = np.zeros(len(pair_ids))
+        for model, rows in self._rows_by_model('xgb', pair_ids):
+            predictions[rows] = np.asarray(model.predict(features[rows])).reshape(len(rows))
+        return predictions.tolist()
+
+    async def _run_lstm_model(self, features: np.ndarray, pair_ids: List[Optional[Tuple[int, int]]]) -> List[float]:
+        """LSTM model implementation (0.0 for pairs without a model)"""
+        # One (rows, timesteps, features) predict call per distinct model, each row one timestep
+        predictions = np.zeros(len(pair_ids))
+        for model, rows in self._rows_by_model('lstm', pair_ids):
+            batch = features[rows][:, np.newaxis, :]
+            predictions[rows] = model.predict(batch, batch_size=len(rows))[:, 0]
+        return predictions.tolist()
+
+    def shutdown(self):
+        """Stop the forecast worker processes"""
+        if self._forecast_pool is not None:
+            self._forecast_pool.shutdown(cancel_futures=True)
+            self._forecast_pool = None
 
     def _update_performance_metrics(self, predictions: Dict[str, MarketPrediction]):
         """Update prediction performance tracking"""
         self.performance_metrics['predictions_made'] += len(predictions)
         
+        # Keep the batch column-wise for scoring against actual outcomes
+        batch = list(predictions.values())
+        columns = np.empty(len(batch), dtype=PREDICTION_DTYPE)
+        columns['predicted_price'] = [p.predicted_price for p in batch]
+        columns['confidence'] = [p.confidence for p in batch]
+        columns['interval_lo'] = [p.prediction_interval[0] for p in batch]
+        columns['interval_hi'] = [p.prediction_interval[1] for p in batch]
+        columns['regime'] = [_REGIME_CODES[p.regime] for p in batch]
+        columns['timestamp'] = [int(p.timestamp.timestamp() * 1e9) for p in batch]
+        self.prediction_columns = columns
+        self.prediction_assets = pd.Categorical([p.asset for p in batch])
+        self.prediction_timeframes = pd.Categorical([p.timeframe for p in batch])
+        
+        if len(columns):
+            self.performance_metrics['model_confidence'] = float(columns['confidence'].mean())
+        
         # Implementation would compare predictions with actual outcomes
         # and update accuracy metrics
 
+def _columns_digest(columns) -> bytes:
+    """Digest of every column (name, dtype, shape and values) in an asset's market data"""
+    digest = hashlib.blake2b(digest_size=16)
+    for name in sorted(columns, key=str):
+        # asarray first: a pandas Series would otherwise be read through its label index
+        values = np.ascontiguousarray(np.asarray(columns[name]))
+        digest.update(f'{name}\0{values.dtype.str}\0{values.shape}\0'.encode())
+        digest.update(repr(values.tolist()).encode() if values.dtype.hasobject else values.tobytes())
+    return digest.digest()
+
 class FeatureEngine:
     """Palantir Foundry-inspired feature engineering"""
     
-    async def extract_features(self, asset: str, timeframe: str, market_data: Dict) -> pd.DataFrame:
-        """Extract comprehensive features for prediction"""
+    def __init__(self, max_cached: int = 256):
+        # (asset, digest of all its market data columns) -> feature task. Keyed on contents because
+        # a rolling window's id is often reused by the next window with the same length and last price
+        self._feature_cache = {}
+        self.max_cached = max_cached
+        
+        # Column names of the feature vectors, set by the first extraction
+        self.feature_names: Optional[List[str]] = None
+    
+    async def extract_features(self, asset: str, timeframe: str, market_data: Dict) -> np.ndarray:
+        """
+        Extract comprehensive features for prediction as a read-only float32 vector ordered
+        like feature_names. None of the features depend on the timeframe, so one extraction
+        per asset's market data is shared by all its timeframes (including concurrent callers).
+        """
+        # Every column is hashed, since the extractors read volume, high/low and more besides close
+        key = (asset, _columns_digest(market_data[asset]))
+        
+        task = self._feature_cache.get(key)
+        if task is None:
+            if len(self._feature_cache) >= self.max_cached:
+                del self._feature_cache[next(iter(self._feature_cache))]
+            task = asyncio.ensure_future(self._build_features(asset, market_data))
+            self._feature_cache[key] = task
+        
+        try:
+            # Shielded so one cancelled caller doesn't cancel the extraction others are awaiting
+            return await asyncio.shield(task)
+        except Exception:
+            if self._feature_cache.get(key) is task:
+                del self._feature_cache[key]
+            raise
+    
+    async def _build_features(self, asset: str, market_data: Dict) -> np.ndarray:
+        """Run every feature extractor for the asset"""
         features = {}
         
         # Price-based features
@@ -371,7 +970,14 @@ class FeatureEngine:
         # Sentiment features
         features.update(await self._extract_sentiment_features(asset, market_data))
         
-        return pd.DataFrame([features])
+        if self.feature_names is None:
+            self.feature_names = list(features)
+        
+        # float32 is all the models need and halves the bytes handed to them
+        vector = np.fromiter((features[name] for name in self.feature_names), dtype=np.float32,
+                             count=len(self.feature_names))
+        vector.flags.writeable = False
+        return vector
 
 class MarketRegimeDetector:
     """Market regime detection using machine learning"""